@@ -0,0 +1,60 @@
+import argparse
+import sys
+
+from src.config import (
+    SYNTHETIC_DATA_DIR,
+    BENCHMARK_BASELINE,
+    BENCHMARK_RESULTS,
+    BENCHMARK_SIZES,
+    BENCHMARK_TIME_TOLERANCE,
+    BENCHMARK_MEMORY_TOLERANCE,
+    BENCHMARK_REPEATS,
+    RANDOM_STATE
+)
+
+from src.benchmark import PipelineBenchmark
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-stage pipeline benchmark on synthetic data")
+    parser.add_argument("--sizes", type=int, nargs="+", default=BENCHMARK_SIZES,
+                        help="row counts to benchmark; large sizes such as 1000000 only run when listed here")
+    parser.add_argument("--repeats", type=int, default=BENCHMARK_REPEATS)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    print("\n===== PIPELINE BENCHMARK STARTED =====")
+
+    benchmark = PipelineBenchmark(
+        work_dir=str(SYNTHETIC_DATA_DIR),
+        sizes=args.sizes,
+        time_tolerance=BENCHMARK_TIME_TOLERANCE,
+        memory_tolerance=BENCHMARK_MEMORY_TOLERANCE,
+        repeats=args.repeats,
+        random_state=RANDOM_STATE
+    )
+
+    results = benchmark.run()
+    benchmark.save_results(results, BENCHMARK_RESULTS)
+    print("\nResults saved to:", BENCHMARK_RESULTS)
+
+    if args.update_baseline or not BENCHMARK_BASELINE.exists():
+        benchmark.save_results(results, BENCHMARK_BASELINE)
+        print("Baseline saved to:", BENCHMARK_BASELINE)
+        return 0
+
+    regressions = benchmark.compare(results, benchmark.load_results(BENCHMARK_BASELINE))
+
+    if regressions:
+        print("\n===== REGRESSIONS DETECTED =====")
+        for r in regressions:
+            print(f"{r['size']:>9} rows  {r['stage']:<26} {r['metric']:<8} "
+                  f"{r['baseline']:.3f} -> {r['current']:.3f} (x{r['ratio']:.2f})")
+        return 1
+
+    print("\n===== NO REGRESSIONS AGAINST BASELINE =====")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,21 +1,56 @@
 import os
 import pandas as pd
+from sklearn.model_selection import train_test_split
 
 from src.config import (
     CLEAN_DATA_DIR,
     RAW_DATA_DIR,
     MERGED_OUTPUT,
+    KEY_INTEGRITY_POLICY,
+    SCHEMA_CONTRACTS,
+    CONTRACT_SAMPLE_ROWS,
     FINAL_DATASET,
+    FEATURE_STORE_DIR,
+    FEATURE_STORE_PARTITIONS,
     MODEL_PATH,
     SCALER_PATH,
+    IMPUTER_PATH,
+    IMPUTATION_STRATEGY,
+    EVALUATION_PATH,
+    DRIFT_PROFILE_PATH,
     TEST_SIZE,
-    RANDOM_STATE
+    RANDOM_STATE,
+    BOOTSTRAP_ROUNDS,
+    CONFIDENCE_LEVEL,
+    CALIBRATION_BINS,
+    LIFT_GROUPS,
+    N_JOBS,
+    DRIFT_BINS,
+    DRIFT_MAX_CATEGORIES,
+    PSI_WARNING_THRESHOLD,
+    PSI_ALERT_THRESHOLD,
+    COMPACT_MODEL_PATH,
+    COMPRESSION_REPORT_PATH,
+    COMPRESS_MODEL,
+    COMPRESSION_AUC_BUDGET,
+    COMPRESSION_MAX_TREES,
+    COMPRESSION_DEPTHS,
+    COMPRESSION_MIN_LEAF_SAMPLES,
+    COMPRESSION_QUANTIZATION_BITS,
+    COMPRESSION_VALIDATION_FRACTION,
+    DISTILLATION_PARAMS,
+    DISTILLATION_TRANSFER_COPIES,
+    DISTILLATION_TRANSFER_NOISE
 )
 
 from src.data_loader import DataLoader
 from src.data_cleaner import DataCleaner
 from src.feature_engineering import FeatureEngineering
 from src.model_trainer import ModelTrainer
+from src.model_evaluator import ModelEvaluator
+from src.drift_monitor import DriftMonitor
+from src.feature_store import FeatureStore
+from src.model_compressor import ModelCompressor
 
 
 def main():
@@ -24,7 +59,11 @@ def main():
     # 1. Load + Clean + Merge All Data
     print("\n>> Loading and merging cleaned datasets...")
 
-    loader = DataLoader()
+    loader = DataLoader(
+        key_policy=KEY_INTEGRITY_POLICY,
+        contracts=SCHEMA_CONTRACTS,
+        contract_sample_rows=CONTRACT_SAMPLE_ROWS
+    )
 
     merged_df = loader.load_and_merge_datasets(
         source=str(RAW_DATA_DIR),
@@ -35,17 +74,30 @@ def main():
 
     print("Merged dataset shape:", merged_df.shape)
 
-    # Remove customer_id if exists
-    if "customer_id" in merged_df.columns:
-        merged_df = merged_df.drop(columns=["customer_id"])
+    for source, result in loader.contract_validator.report.items():
+        print(f"  contract {source}: {result['status']} ({result.get('checked_on', '-')})")
+
+    for source, stats in loader.merge_report.items():
+        print(f"  {source}: rows={stats['rows']} unique_keys={stats['unique_keys']} "
+              f"fan_out={stats['fan_out']:.2f} action={stats['action']}")
 
     # 2. Feature Engineering
     print("\n>> Feature engineering...")
 
-    fe = FeatureEngineering()
-    df = fe.fill_missing_values(merged_df)
+    fe = FeatureEngineering(imputation_strategy=IMPUTATION_STRATEGY)
     df = fe.remove_low_corr(merged_df)
 
+    # Materialize per-customer features for lookups by customer_id
+    if "customer_id" in df.columns:
+        store = FeatureStore(str(FEATURE_STORE_DIR), n_partitions=FEATURE_STORE_PARTITIONS)
+        store_stats = store.build(df.drop(columns=["default"], errors="ignore"))
+        print("Feature store partitions written/unchanged:",
+              store_stats["written"], "/", store_stats["unchanged"])
+
+    # Remove customer_id if exists
+    if "customer_id" in df.columns:
+        df = df.drop(columns=["customer_id"])
+
     print("After FE shape:", df.shape)
 
     # 3. Save FE-processed data
@@ -58,32 +110,117 @@ def main():
 
     X_train, X_test, y_train, y_test = trainer.split(df)
 
-    # 5. SMOTE balancing
+    # 5. Imputation (statistics learned on the training split only)
+    print(">> Imputing missing values...")
+    X_train_imp, X_test_imp = fe.impute(X_train, X_test)
+
+    # 6. SMOTE balancing
     print(">> Applying SMOTE balancing...")
-    X_train_res, y_train_res = trainer.smote(X_train, y_train)
+    X_train_res, y_train_res = trainer.smote(X_train_imp, y_train)
 
-    # 6. Scaling
+    # 7. Scaling
     print(">> Scaling numeric features...")
-    X_train_scaled, X_test_scaled = fe.scale(X_train_res, X_test)
+    X_train_scaled, X_test_scaled = fe.scale(X_train_res, X_test_imp)
 
-    # 7. Train Model
+    # 8. Train Model
     print("\n>> Training RandomForest model...")
     model = trainer.fit(X_train_scaled, y_train_res)
 
-    # 8. Evaluate Model
+    # 9. Evaluate Model
     print("\n===== MODEL EVALUATION =====")
-    evaluation = trainer.evaluate(X_test_scaled, y_test)
-    
+    evaluator = ModelEvaluator(
+        n_bootstrap=BOOTSTRAP_ROUNDS,
+        confidence=CONFIDENCE_LEVEL,
+        n_calibration_bins=CALIBRATION_BINS,
+        n_lift_groups=LIFT_GROUPS,
+        n_jobs=N_JOBS,
+        random_state=RANDOM_STATE
+    )
+
+    # one scoring pass feeds every metric below
+    y_prob = model.predict_proba(X_test_scaled)[:, 1]
+    evaluation = evaluator.classification_summary(y_test, y_prob)
+
     print("\nAccuracy:", evaluation["accuracy"])
     print("\nClassification Report:\n", evaluation["report"])
 
-    # 9. Save Model + Scaler
-    print("\n>> Saving model and scaler...")
+    eval_report = evaluator.evaluate(y_test, y_prob)
+
+    for name, value in eval_report["metrics"].items():
+        ci = eval_report.get("confidence_intervals", {}).get(name)
+        if ci:
+            print(f"{name}: {value:.4f} [{ci['lower']:.4f}, {ci['upper']:.4f}]")
+        else:
+            print(f"{name}: {value:.4f}")
+
+    evaluator.save_report(eval_report, EVALUATION_PATH)
+    print("Evaluation report saved to:", EVALUATION_PATH)
+
+    # 10. Save Model + Scaler + Imputer
+    print("\n>> Saving model, scaler and imputer...")
     trainer.save_model(MODEL_PATH)
     fe.save_scaler(SCALER_PATH)
+    fe.save_imputer(IMPUTER_PATH)
 
     print("Model saved to:", MODEL_PATH)
     print("Scaler saved to:", SCALER_PATH)
+    print("Imputer saved to:", IMPUTER_PATH)
+
+    # 11. Training distribution profile for drift monitoring
+    print("\n>> Capturing feature distributions for drift monitoring...")
+    monitor = DriftMonitor(
+        n_bins=DRIFT_BINS,
+        max_categories=DRIFT_MAX_CATEGORIES,
+        warning_threshold=PSI_WARNING_THRESHOLD,
+        alert_threshold=PSI_ALERT_THRESHOLD
+    )
+    monitor.fit(X_train)
+    monitor.fit_scores(y_prob)
+    monitor.save(DRIFT_PROFILE_PATH)
+    print("Drift profile saved to:", DRIFT_PROFILE_PATH)
+
+    # 12. Compact model for low-latency deployment
+    if COMPRESS_MODEL:
+        print("\n>> Compressing model...")
+        X_val, X_hold, y_val, y_hold = train_test_split(
+            X_test_scaled, y_test,
+            train_size=COMPRESSION_VALIDATION_FRACTION,
+            stratify=y_test,
+            random_state=RANDOM_STATE
+        )
+
+        compressor = ModelCompressor(
+            auc_budget=COMPRESSION_AUC_BUDGET,
+            max_trees=COMPRESSION_MAX_TREES,
+            depths=COMPRESSION_DEPTHS,
+            min_leaf_samples=COMPRESSION_MIN_LEAF_SAMPLES,
+            quantization_bits=COMPRESSION_QUANTIZATION_BITS,
+            distillation_params=DISTILLATION_PARAMS,
+            transfer_copies=DISTILLATION_TRANSFER_COPIES,
+            transfer_noise=DISTILLATION_TRANSFER_NOISE,
+            random_state=RANDOM_STATE
+        )
+        compact_model, compression = compressor.compress(model, X_val, y_val, X_hold, y_hold)
+        compressor.save_report(compression, COMPRESSION_REPORT_PATH)
+
+        original = compression["original"]
+        print(f"original: auc={original['auc']:.4f} size={original['size_bytes'] / 1024:.0f} KB "
+              f"latency={original['single_row_ms']:.2f} ms/row")
+        for name, stats in compression["candidates"].items():
+            status = "ok" if stats["within_budget"] else "over budget"
+            print(f"  {name:<32} held-out auc loss={stats['auc_loss']:+.4f} "
+                  f"(budget {compression['auc_budget']}) {status}")
+
+        if compact_model is None:
+            print("No candidate within the AUC budget; keeping the full model only")
+        else:
+            best = compression["candidates"][compression["selected"]]
+            print(f"{compression['selected']}: auc={best['auc']:.4f} size={best['size_bytes'] / 1024:.0f} KB "
+                  f"latency={best['single_row_ms']:.2f} ms/row")
+            compressor.save_model(compact_model, COMPACT_MODEL_PATH)
+            print("Compact model saved to:", COMPACT_MODEL_PATH)
+
+        print("Compression report saved to:", COMPRESSION_REPORT_PATH)
 
     print("\n===== PIPELINE FINISHED SUCCESSFULLY =====")
 
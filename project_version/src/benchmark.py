@@ -0,0 +1,236 @@
+# src/benchmark.py
+
+import json
+import multiprocessing
+import resource
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.data_loader import DataLoader
+from src.data_cleaner import DataCleaner
+from src.feature_engineering import FeatureEngineering
+from src.model_trainer import ModelTrainer
+from src.synthetic_data import SyntheticDataGenerator
+
+
+def _reset_peak_rss() -> bool:
+    # Linux (>= 4.0) resets the VmHWM high-water mark on "5", so ru_maxrss then
+    # covers only what runs afterwards; elsewhere the forked child keeps the
+    # parent's high-water mark and the peak is an upper bound
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+
+def _measure_stage(fn: Callable[[Dict], None], state: Dict, python_heap: bool, conn):
+    # runs in a forked child: the stage sees the parent's state as it was at the
+    # fork and nothing the child allocates leaks back into the parent
+    if python_heap:
+        tracemalloc.start()
+        fn(state)
+        conn.send(tracemalloc.get_traced_memory()[1] / 1024 ** 2)
+    else:
+        _reset_peak_rss()
+        fn(state)
+        conn.send(_peak_rss_mb())
+    conn.close()
+
+
+class PipelineBenchmark:
+    STAGES = [
+        "load_and_merge_datasets",
+        "clean_dataframe",
+        "remove_low_corr",
+        "split",
+        "impute",
+        "smote",
+        "scale",
+        "fit",
+        "predict_proba",
+    ]
+
+    def __init__(
+            self,
+            work_dir: str,
+            sizes: Optional[List[int]] = None,
+            time_tolerance: float = 0.25,
+            memory_tolerance: float = 0.25,
+            min_seconds: float = 0.05,
+            min_memory_mb: float = 5.0,
+            repeats: int = 3,
+            random_state: int = 42
+    ):
+        self.work_dir = Path(work_dir)
+        self.sizes = sizes or [10_000, 100_000]
+        self.time_tolerance = time_tolerance
+        self.memory_tolerance = memory_tolerance
+        self.min_seconds = min_seconds
+        self.min_memory_mb = min_memory_mb
+        self.repeats = max(1, repeats)
+        self.random_state = random_state
+
+    def generate(self, n_rows: int) -> List[str]:
+        data_dir = self.work_dir / f"rows_{n_rows}"
+        generator = SyntheticDataGenerator(n_rows=n_rows, random_state=self.random_state)
+        return list(generator.write(str(data_dir)).values())
+
+    def _stages(self, file_paths: List[str]) -> List[Tuple[str, Callable[[Dict], None]]]:
+        # fresh objects per pass; every stage reads and writes the shared state
+        loader = DataLoader()
+        cleaner = DataCleaner()
+        fe = FeatureEngineering()
+        trainer = ModelTrainer(random_state=self.random_state)
+
+        def load(s):
+            s["df"] = loader.load_and_merge_datasets(source=file_paths, clean=False)
+
+        def clean(s):
+            s["df"] = cleaner.clean_dataframe(s["df"]).drop(columns=["customer_id"], errors="ignore")
+
+        def remove_low_corr(s):
+            s["df"] = fe.remove_low_corr(s["df"])
+
+        def split(s):
+            s["X_train"], s["X_test"], s["y_train"], s["y_test"] = trainer.split(s["df"])
+
+        def impute(s):
+            s["X_train"], s["X_test"] = fe.impute(s["X_train"], s["X_test"])
+
+        def smote(s):
+            s["X_train"], s["y_train"] = trainer.smote(s["X_train"], s["y_train"])
+
+        def scale(s):
+            s["X_train"], s["X_test"] = fe.scale(s["X_train"], s["X_test"])
+
+        def fit(s):
+            s["model"] = trainer.fit(s["X_train"], s["y_train"])
+
+        def predict_proba(s):
+            s["model"].predict_proba(s["X_test"])
+
+        return list(zip(self.STAGES, [
+            load, clean, remove_low_corr, split, impute, smote, scale, fit, predict_proba
+        ]))
+
+    def _time_pass(self, file_paths: List[str]) -> Dict[str, float]:
+        state: Dict = {}
+        seconds = {}
+        for stage, fn in self._stages(file_paths):
+            start = time.perf_counter()
+            fn(state)
+            seconds[stage] = time.perf_counter() - start
+        return seconds
+
+    def _run_in_child(self, fn: Callable[[Dict], None], state: Dict, python_heap: bool) -> float:
+        context = multiprocessing.get_context("fork")
+        receiver, sender = context.Pipe(duplex=False)
+        child = context.Process(target=_measure_stage, args=(fn, state, python_heap, sender))
+        child.start()
+        sender.close()
+        try:
+            value = receiver.recv()
+        except EOFError:
+            value = None
+        child.join()
+        if value is None or child.exitcode != 0:
+            raise RuntimeError(f"memory measurement child exited with code {child.exitcode}")
+        return value
+
+    def _memory_pass(self, file_paths: List[str]) -> Dict[str, Dict[str, float]]:
+        # each stage runs in two forked children, one reading peak RSS (what the
+        # process really holds, sklearn's C buffers included) and one under
+        # tracemalloc for the Python heap alone; the parent then runs the stage
+        # to advance the state, so no measurement ever touches a timed pass
+        state: Dict = {}
+        memory = {}
+        for stage, fn in self._stages(file_paths):
+            memory[stage] = {
+                "peak_rss_mb": self._run_in_child(fn, state, python_heap=False),
+                "python_heap_mb": self._run_in_child(fn, state, python_heap=True),
+            }
+            fn(state)
+        return memory
+
+    def run_size(self, n_rows: int) -> Dict[str, Dict[str, float]]:
+        print(f"\n>> Benchmarking {n_rows} rows ({self.repeats} timed runs + 1 memory run)...")
+        file_paths = self.generate(n_rows)
+
+        timings = [self._time_pass(file_paths) for _ in range(self.repeats)]
+        memory = self._memory_pass(file_paths)
+
+        results: Dict[str, Dict[str, float]] = {}
+        for stage in self.STAGES:
+            samples = [t[stage] for t in timings]
+            # best of N is the least noisy estimate of the stage's real cost
+            results[stage] = {
+                "seconds": float(np.min(samples)),
+                "seconds_median": float(np.median(samples)),
+                **memory[stage],
+            }
+            print(f"  {stage:<26} {results[stage]['seconds']:>9.3f}s "
+                  f"(median {results[stage]['seconds_median']:.3f}s) "
+                  f"{memory[stage]['peak_rss_mb']:>10.1f} MB RSS "
+                  f"{memory[stage]['python_heap_mb']:>9.1f} MB heap")
+
+        return results
+
+    def run(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        return {str(n_rows): self.run_size(n_rows) for n_rows in self.sizes}
+
+    def compare(self, results: Dict, baseline: Dict) -> List[Dict]:
+        regressions = []
+
+        for size, stages in results.items():
+            if size not in baseline:
+                continue
+
+            for stage, current in stages.items():
+                reference = baseline[size].get(stage)
+                if reference is None:
+                    continue
+
+                # python_heap_mb is informational; the memory gate is on RSS
+                checks = [
+                    ("seconds", self.time_tolerance, self.min_seconds),
+                    ("peak_rss_mb", self.memory_tolerance, self.min_memory_mb),
+                ]
+                for metric, tolerance, floor in checks:
+                    if metric not in reference:
+                        # baselines written before the metric existed
+                        continue
+                    limit = reference[metric] * (1 + tolerance)
+                    if current[metric] > limit and current[metric] - reference[metric] > floor:
+                        regressions.append({
+                            "size": size,
+                            "stage": stage,
+                            "metric": metric,
+                            "baseline": reference[metric],
+                            "current": current[metric],
+                            "ratio": current[metric] / reference[metric] if reference[metric] else float("inf"),
+                        })
+
+        return regressions
+
+    def save_results(self, results: Dict, path: str):
+        path = Path(path)
+        path.parent.mkdir(exist_ok=True, parents=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    def load_results(self, path: str) -> Dict:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
@@ -19,6 +19,7 @@ PROCESSED_DATA_DIR = DATA_DIR / "processed"
 # MODEL DIRECTORY
 # =============================
 MODEL_DIR = BASE_DIR / "models"
+FEATURE_STORE_DIR = DATA_DIR / "feature_store"
 
 # =============================
 # Create required directories
@@ -39,14 +40,248 @@ for folder in [
 MERGED_OUTPUT = MERGED_DATA_DIR / "merged_clean_data.csv"
 FINAL_DATASET = PROCESSED_DATA_DIR / "final.csv"
 
+# =============================
+# KEY INTEGRITY (customer_id join)
+# =============================
+# Sources with several rows per customer are rejected unless they declare
+# how to collapse them: latest / first / sum / count / max / min / mean
+KEY_INTEGRITY_POLICY = {
+    "default": "reject",
+    "sources": {
+        "loan_details": {
+            "on_duplicates": "aggregate",
+            "default_aggregation": "latest",
+            "aggregations": {
+                "loan_amount": "sum",
+                "loan_term": "max",
+                "interest_rate": "max",
+                "loan_to_value_ratio": "max",
+            },
+        },
+        "credit_history": {
+            "on_duplicates": "aggregate",
+            "default_aggregation": "latest",
+            "aggregations": {
+                "num_credit_accounts": "max",
+                "num_delinquencies_2yrs": "max",
+                "num_inquiries_6mo": "max",
+                "num_public_records": "max",
+                "num_collections": "max",
+            },
+        },
+    },
+}
+
+# =============================
+# SCHEMA CONTRACTS (raw sources)
+# =============================
+# Checked per file stem on parquet metadata or the first CONTRACT_SAMPLE_ROWS
+# rows before anything is loaded. Values are checked as they arrive: numeric
+# columns may carry "$1,234" formatting, categories ignore case and padding.
+# Bounds are the ones the domain itself imposes (non-negative amounts and
+# counts, hours, FICO 300-850); limits only the synthetic generator implies are
+# left open, and real loan_details carries loan_term 0. Category lists follow
+# the spellings DataCleaner standardizes.
+CONTRACT_SAMPLE_ROWS = 10_000
+
+SCHEMA_CONTRACTS = {
+    "application_metadata": {
+        "key": "customer_ref",
+        "unique_key": True,
+        "required": ["default"],
+        "dtypes": {
+            "application_hour": "integer",
+            "application_day_of_week": "integer",
+            "account_open_year": "integer",
+            "num_login_sessions": "integer",
+            "num_customer_service_calls": "integer",
+            "default": "integer",
+        },
+        "ranges": {
+            "application_hour": [0, 23],
+            "application_day_of_week": [0, 6],
+            "account_open_year": [1950, 2100],
+            "num_login_sessions": [0, None],
+            "num_customer_service_calls": [0, None],
+            "has_mobile_app": [0, 1],
+            "paperless_billing": [0, 1],
+            "default": [0, 1],
+        },
+    },
+    "credit_history": {
+        "key": "customer_number",
+        "dtypes": {
+            "credit_score": "numeric",
+            "num_credit_accounts": "integer",
+            "total_credit_limit": "numeric",
+        },
+        "ranges": {
+            "credit_score": [300, 850],
+            "num_credit_accounts": [0, None],
+            "oldest_credit_line_age": [0, None],
+            "total_credit_limit": [0, None],
+            "num_delinquencies_2yrs": [0, None],
+            "num_inquiries_6mo": [0, None],
+            "num_public_records": [0, None],
+            "num_collections": [0, None],
+            "account_diversity_index": [0, None],
+        },
+    },
+    "demographics": {
+        "key": "cust_id",
+        "unique_key": True,
+        "dtypes": {
+            "age": "integer",
+            "annual_income": "numeric",
+            "employment_length": "numeric",
+            "num_dependents": "integer",
+        },
+        "ranges": {
+            "age": [18, 120],
+            "annual_income": [0, None],
+            "employment_length": [0, None],
+            "num_dependents": [0, None],
+        },
+        "categories": {
+            "employment_type": [
+                "Full-time", "Full_Time", "Full Time", "Fulltime", "FT",
+                "Part-time", "Part_Time", "Part Time", "Parttime", "PT",
+                "Self-employed", "Self_Employed", "Self Employed", "Self Emp", "Self-Emp",
+                "Contract", "Contractor",
+            ],
+        },
+    },
+    "financial_ratios": {
+        "key": "cust_num",
+        "unique_key": True,
+        "dtypes": {
+            "monthly_income": "numeric",
+            "existing_monthly_debt": "numeric",
+            "monthly_payment": "numeric",
+            "debt_to_income_ratio": "numeric",
+            "credit_utilization": "numeric",
+            "revolving_balance": "numeric",
+        },
+        "ranges": {
+            "monthly_income": [0, None],
+            "existing_monthly_debt": [0, None],
+            "monthly_payment": [0, None],
+            "debt_to_income_ratio": [0, None],
+            "credit_utilization": [0, None],
+        },
+    },
+    "geographic_data": {
+        "key": "id",
+        "unique_key": True,
+        "required": ["state"],
+        "dtypes": {
+            "regional_unemployment_rate": "numeric",
+            "regional_median_income": "numeric",
+        },
+        "ranges": {
+            "regional_unemployment_rate": [0, 100],
+            "regional_median_income": [0, None],
+            "regional_median_rent": [0, None],
+        },
+    },
+    "loan_details": {
+        "key": "customer_id",
+        "dtypes": {
+            "loan_amount": "numeric",
+            "loan_term": "integer",
+            "interest_rate": "numeric",
+        },
+        "ranges": {
+            "loan_amount": [0, None],
+            "loan_term": [0, 600],
+            "interest_rate": [0, 100],
+            "loan_to_value_ratio": [0, None],
+        },
+    },
+}
+
 # =============================
 # MODEL FILES
 # =============================
 MODEL_PATH = MODEL_DIR / "model_rf.pkl"
 SCALER_PATH = MODEL_DIR / "scaler.pkl"
+IMPUTER_PATH = MODEL_DIR / "imputer.pkl"
+EVALUATION_PATH = MODEL_DIR / "evaluation.json"
+DRIFT_PROFILE_PATH = MODEL_DIR / "drift_profile.pkl"
+COMPACT_MODEL_PATH = MODEL_DIR / "model_compact.pkl"
+COMPRESSION_REPORT_PATH = MODEL_DIR / "compression.json"
 
 # =============================
 # TRAINING CONFIG
 # =============================
 TEST_SIZE = 0.20
-RANDOM_STATE = 42
\ No newline at end of file
+RANDOM_STATE = 42
+
+# =============================
+# IMPUTATION CONFIG
+# =============================
+# median / mode / {"strategy": "constant", "fill_value": v} per column
+IMPUTATION_STRATEGY = {
+    "default_numeric": "median",
+    "default_categorical": "mode",
+    "columns": {
+        "num_collections": {"strategy": "constant", "fill_value": 0},
+    },
+}
+
+# =============================
+# EVALUATION CONFIG
+# =============================
+BOOTSTRAP_ROUNDS = 200
+CONFIDENCE_LEVEL = 0.95
+CALIBRATION_BINS = 10
+LIFT_GROUPS = 10
+N_JOBS = -1
+
+# =============================
+# DRIFT MONITORING CONFIG
+# =============================
+DRIFT_BINS = 10
+DRIFT_MAX_CATEGORIES = 50
+PSI_WARNING_THRESHOLD = 0.10
+PSI_ALERT_THRESHOLD = 0.25
+
+# =============================
+# BENCHMARK CONFIG
+# =============================
+SYNTHETIC_DATA_DIR = DATA_DIR / "synthetic"
+BENCHMARK_DIR = BASE_DIR / "benchmarks"
+BENCHMARK_BASELINE = BENCHMARK_DIR / "baseline.json"
+BENCHMARK_RESULTS = BENCHMARK_DIR / "latest.json"
+# fast regression tier; pass e.g. --sizes 1000000 for the large run
+BENCHMARK_SIZES = [10_000, 100_000]
+BENCHMARK_TIME_TOLERANCE = 0.25
+BENCHMARK_MEMORY_TOLERANCE = 0.25
+BENCHMARK_REPEATS = 3  # timed runs per size; the gate uses the best one
+
+# =============================
+# FEATURE STORE CONFIG
+# =============================
+FEATURE_STORE_PARTITIONS = 64
+
+# =============================
+# MODEL COMPRESSION CONFIG
+# =============================
+# Half of the test split selects trees and is the distillation transfer set;
+# the smallest candidate whose AUC on the other, held-out half stays within the
+# budget of the full forest is saved
+COMPRESS_MODEL = True
+COMPRESSION_AUC_BUDGET = 0.005
+COMPRESSION_MAX_TREES = 50
+COMPRESSION_DEPTHS = [6, 8, 10, 12, None]
+COMPRESSION_MIN_LEAF_SAMPLES = 5
+COMPRESSION_QUANTIZATION_BITS = 8
+COMPRESSION_VALIDATION_FRACTION = 0.5
+DISTILLATION_PARAMS = [
+    {"max_iter": 100, "max_depth": 3},
+    {"max_iter": 200, "max_depth": 4},
+]
+# jittered copies of the selection rows added to the transfer set, and their
+# noise in units of each feature's std
+DISTILLATION_TRANSFER_COPIES = 4
+DISTILLATION_TRANSFER_NOISE = 0.1
@@ -1,16 +1,26 @@
 import json
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import pandas as pd
 from pandas import DataFrame
 
 class DataLoader:
     
-    def __init__(self):
+    def __init__(
+            self,
+            key_policy: Optional[Dict] = None,
+            contracts: Optional[Dict] = None,
+            contract_sample_rows: int = 10_000
+    ):
         from src.data_cleaner import DataCleaner
+        from src.key_integrity import KeyIntegrityChecker
+        from src.schema_contracts import SchemaContractValidator
 
         self.cleaner = DataCleaner()
+        self.key_checker = KeyIntegrityChecker(key_policy)
+        self.contract_validator = SchemaContractValidator(contracts, sample_rows=contract_sample_rows)
+        self.merge_report = {}
 
         self.id_column_aliases = {
             'cust_id', 'customer_id', 'cust_num', 'customer_num',
@@ -130,34 +140,43 @@ class DataLoader:
             raise ValueError("No files found to process")
 
         merged_df = None
+        self.merge_report = {}
+        self.contract_validator.report = {}
 
-        for i, file_path in enumerate(file_paths):
+        # contracts run on metadata or the first chunk of every file before
+        # any full load, so a bad source fails before load/clean/merge cost
+        for file_path in file_paths:
+            self.contract_validator.validate_file(file_path, Path(file_path).stem)
 
-            try:
+        for file_path in file_paths:
+            source_name = Path(file_path).stem
 
-                df = self.load_df(file_path, clean=False)
+            df = self.load_df(file_path, clean=False)
 
-                id_col = self._detect_id_column(df)
-                if not id_col:
-                    continue
+            id_col = self._detect_id_column(df)
+            if not id_col:
+                raise ValueError(
+                    f"No customer id column in {file_path}; expected one of {sorted(self.id_column_aliases)}"
+                )
 
-                if clean:
-                    df = self.cleaner.clean_dataframe(df)
+            if clean:
+                df = self.cleaner.clean_dataframe(df)
 
-                if id_col != merge_on:
-                    df = df.rename(columns={id_col: merge_on})
+            if id_col != merge_on:
+                df = df.rename(columns={id_col: merge_on})
 
-                if merged_df is None:
-                    merged_df = df
+            df, key_stats = self.key_checker.resolve(df, merge_on, source_name)
 
-                else:
-                    before_cols = len(merged_df.columns)
-                    merged_df = merged_df.merge(df, on=merge_on, how='outer', suffixes=('', '_dup'))
-                    after_cols = len(merged_df.columns)
+            if merged_df is None:
+                merged_df = df
 
-            except Exception as e:
+            else:
+                before_rows = len(merged_df)
+                merged_df = merged_df.merge(df, on=merge_on, how='outer', suffixes=('', '_dup'))
+                key_stats['merged_rows_before'] = before_rows
+                key_stats['merged_rows_after'] = len(merged_df)
 
-                continue
+            self.merge_report[source_name] = key_stats
 
         if merged_df is None:
             raise ValueError("No data was successfully loaded and merged")
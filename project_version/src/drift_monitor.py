@@ -0,0 +1,140 @@
+# src/drift_monitor.py
+
+from typing import Dict
+
+import joblib
+import numpy as np
+import pandas as pd
+
+SCORE_FEATURE = "__score__"
+
+
+class DriftMonitor:
+    def __init__(
+            self,
+            n_bins: int = 10,
+            max_categories: int = 50,
+            warning_threshold: float = 0.10,
+            alert_threshold: float = 0.25,
+            epsilon: float = 1e-4
+    ):
+        self.n_bins = n_bins
+        self.max_categories = max_categories
+        self.warning_threshold = warning_threshold
+        self.alert_threshold = alert_threshold
+        self.epsilon = epsilon
+
+        self.features: Dict[str, Dict] = {}
+
+    def fit(self, df: pd.DataFrame):
+        self.features = {}
+        for col in df.columns:
+            self.features[col] = self._fit_column(df[col])
+        return self
+
+    def fit_scores(self, scores):
+        self.features[SCORE_FEATURE] = self._fit_numeric(pd.Series(np.asarray(scores).ravel()))
+        return self
+
+    def _fit_column(self, series: pd.Series) -> Dict:
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            return self._fit_numeric(series)
+        return self._fit_categorical(series)
+
+    def _fit_numeric(self, series: pd.Series) -> Dict:
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        observed = values[~np.isnan(values)]
+
+        if len(observed):
+            quantiles = np.linspace(0, 1, self.n_bins + 1)[1:-1]
+            edges = np.unique(np.quantile(observed, quantiles))
+        else:
+            edges = np.array([], dtype=np.float64)
+
+        profile = {"type": "numeric", "edges": edges}
+        profile["expected"] = self._bin_counts(profile, series)
+        profile["actual"] = np.zeros_like(profile["expected"])
+        return profile
+
+    def _fit_categorical(self, series: pd.Series) -> Dict:
+        top = series.dropna().astype(str).value_counts().head(self.max_categories)
+
+        profile = {"type": "categorical", "categories": pd.Index(top.index)}
+        profile["expected"] = self._bin_counts(profile, series)
+        profile["actual"] = np.zeros_like(profile["expected"])
+        return profile
+
+    def _bin_counts(self, profile: Dict, series: pd.Series) -> np.ndarray:
+        # layout: [value bins..., missing] for numerics,
+        #         [categories..., other, missing] for categoricals
+        if profile["type"] == "numeric":
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            n_value_bins = len(profile["edges"]) + 1
+            idx = np.searchsorted(profile["edges"], values, side="right")
+            idx[np.isnan(values)] = n_value_bins
+            return np.bincount(idx, minlength=n_value_bins + 1).astype(np.int64)
+
+        categories = profile["categories"]
+        n_cats = len(categories)
+        missing = series.isna().to_numpy()
+        idx = categories.get_indexer(series.astype(str))
+        idx[idx < 0] = n_cats
+        idx[missing] = n_cats + 1
+        return np.bincount(idx, minlength=n_cats + 2).astype(np.int64)
+
+    def update(self, df: pd.DataFrame, scores=None):
+        for col, profile in self.features.items():
+            if col == SCORE_FEATURE or col not in df.columns:
+                continue
+            profile["actual"] += self._bin_counts(profile, df[col])
+
+        if scores is not None and SCORE_FEATURE in self.features:
+            profile = self.features[SCORE_FEATURE]
+            profile["actual"] += self._bin_counts(profile, pd.Series(np.asarray(scores).ravel()))
+
+        return self
+
+    def reset(self):
+        for profile in self.features.values():
+            profile["actual"][:] = 0
+        return self
+
+    def _stability_index(self, expected: np.ndarray, actual: np.ndarray) -> float:
+        if actual.sum() == 0 or expected.sum() == 0:
+            return np.nan
+
+        e = np.maximum(expected / expected.sum(), self.epsilon)
+        a = np.maximum(actual / actual.sum(), self.epsilon)
+        return float(np.sum((a - e) * np.log(a / e)))
+
+    def _status(self, value: float) -> str:
+        if np.isnan(value):
+            return "no_data"
+        if value >= self.alert_threshold:
+            return "alert"
+        if value >= self.warning_threshold:
+            return "warning"
+        return "stable"
+
+    def report(self) -> Dict[str, Dict]:
+        report = {}
+        for col, profile in self.features.items():
+            value = self._stability_index(profile["expected"], profile["actual"])
+            report[col] = {
+                "index": "psi" if col == SCORE_FEATURE else "csi",
+                "value": value,
+                "status": self._status(value),
+                "n_observed": int(profile["actual"].sum()),
+            }
+        return report
+
+    def flagged_features(self, min_status: str = "warning") -> Dict[str, Dict]:
+        levels = ["warning", "alert"] if min_status == "warning" else ["alert"]
+        return {col: row for col, row in self.report().items() if row["status"] in levels}
+
+    def save(self, path: str = "drift_profile.pkl"):
+        joblib.dump(self, path)
+
+    @staticmethod
+    def load(path: str = "drift_profile.pkl") -> "DriftMonitor":
+        return joblib.load(path)
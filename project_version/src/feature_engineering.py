@@ -3,6 +3,8 @@
 import pandas as pd
 from sklearn.preprocessing import StandardScaler
 
+from src.imputer import FeatureImputer
+
 LOW_CORR_COLS = [
     'cost_of_living_index',
     'regional_unemployment_rate',
@@ -50,12 +52,27 @@ LOW_CORR_COLS = [
 
 
 class FeatureEngineering:
-    def __init__(self):
+    def __init__(self, imputation_strategy=None):
         self.scaler = StandardScaler()
+        self.imputer = FeatureImputer(imputation_strategy)
 
     def remove_low_corr(self, df: pd.DataFrame):
         return df.drop(columns=LOW_CORR_COLS, errors="ignore")
 
+    def impute(self, X_train, X_test):
+        X_train = self.imputer.fit_transform(X_train)
+        X_test = self.imputer.transform(X_test)
+        return X_train, X_test
+
+    def save_imputer(self, path="imputer.pkl"):
+        import joblib
+        joblib.dump(self.imputer, path)
+
+    def load_imputer(self, path="imputer.pkl"):
+        import joblib
+        self.imputer = joblib.load(path)
+        return self.imputer
+
     def scale(self, X_train, X_test):
         X_train = self.scaler.fit_transform(X_train)
         X_test = self.scaler.transform(X_test)
@@ -69,10 +86,4 @@ class FeatureEngineering:
         import joblib
         self.scaler = joblib.load(path)
         return self.scaler
-    
-    def fill_missing_values(self, df: pd.DataFrame):
-        if 'employment_length' in df.columns:
-            mode_val = df['employment_length'].mode()[0]
-            df['employment_length'].fillna(mode_val, inplace=True)
-        return df
 
@@ -0,0 +1,251 @@
+# src/feature_store.py
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+MANIFEST_FILE = "manifest.json"
+INDEX_FILE = "_index.npy"
+
+
+# layout: root/manifest.json + root/<partition dir>/<column>.npy, where
+# _index.npy holds the partition's customer ids in sorted order and every
+# column file is aligned with it; string columns are stored as int32 codes
+# against an append-only dictionary kept in the manifest
+class FeatureStore:
+    def __init__(self, root_dir: str, key: str = "customer_id", n_partitions: int = 64):
+        self.root_dir = Path(root_dir)
+        self.key = key
+        self.n_partitions = n_partitions
+
+        self.manifest: Optional[Dict] = None
+        self._manifest_stat = None
+        self._open_partitions: Dict[int, Dict[str, np.ndarray]] = {}
+
+        if (self.root_dir / MANIFEST_FILE).exists():
+            self.refresh()
+
+    def _stat_manifest(self):
+        try:
+            st = os.stat(self.root_dir / MANIFEST_FILE)
+        except FileNotFoundError:
+            return None
+        # os.replace swaps the inode, so a rebuild is seen even within one mtime tick
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def refresh(self):
+        stat = self._stat_manifest()
+        with open(self.root_dir / MANIFEST_FILE, "r", encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        self._manifest_stat = stat
+        self.key = self.manifest["key"]
+        self._open_partitions = {}
+        return self
+
+    def refresh_if_changed(self) -> bool:
+        stat = self._stat_manifest()
+        if stat is None or stat == self._manifest_stat:
+            return False
+        self.refresh()
+        return True
+
+    @property
+    def columns(self) -> List[str]:
+        return [c["name"] for c in self.manifest["columns"]] if self.manifest else []
+
+    @staticmethod
+    def _partition_of(ids: np.ndarray, n_partitions: int) -> np.ndarray:
+        return np.mod(ids, n_partitions)
+
+    def _schema(self, df: DataFrame, previous: Optional[Dict]) -> List[Dict]:
+        old = {c["name"]: c for c in previous["columns"]} if previous else {}
+        schema = []
+
+        for col in df.columns:
+            if col == self.key:
+                continue
+
+            series = df[col]
+            if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                dtype = "float64" if series.isna().any() else series.dtype.name
+                schema.append({"name": col, "dtype": dtype})
+                continue
+
+            categories = list(old[col].get("categories", [])) if col in old else []
+            known = set(categories)
+            for value in pd.unique(series.dropna().astype(str)):
+                if value not in known:
+                    categories.append(value)
+                    known.add(value)
+            schema.append({"name": col, "dtype": "category", "categories": categories})
+
+        return schema
+
+    def _encode(self, series: pd.Series, spec: Dict) -> np.ndarray:
+        if spec["dtype"] == "category":
+            codes = pd.Index(spec["categories"]).get_indexer(series.astype(str))
+            codes[series.isna().to_numpy()] = -1
+            return codes.astype(np.int32)
+        return series.to_numpy(dtype=spec["dtype"])
+
+    def _checksum(self, arrays: Dict[str, np.ndarray], schema: List[Dict]) -> str:
+        digest = hashlib.sha256(json.dumps([(c["name"], c["dtype"]) for c in schema]).encode())
+        for name in [INDEX_FILE] + [c["name"] for c in schema]:
+            digest.update(np.ascontiguousarray(arrays[name]).tobytes())
+        return digest.hexdigest()
+
+    def _write_manifest(self, manifest: Dict):
+        tmp_path = self.root_dir / f"{MANIFEST_FILE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, self.root_dir / MANIFEST_FILE)
+
+    def build(self, df: DataFrame) -> Dict[str, int]:
+        if self.key not in df.columns:
+            raise ValueError(f"Key column '{self.key}' not found")
+
+        ids = df[self.key].to_numpy().astype(np.int64)
+
+        if len(np.unique(ids)) != len(ids):
+            raise ValueError(f"Key column '{self.key}' is not unique")
+
+        self.root_dir.mkdir(exist_ok=True, parents=True)
+
+        self.refresh_if_changed()
+        current = self.manifest
+        previous = current
+        if previous and previous["n_partitions"] != self.n_partitions:
+            previous = None
+
+        schema = self._schema(df, previous)
+        old_parts = previous["partitions"] if previous else {}
+
+        order = np.argsort(ids, kind="stable")
+        sorted_ids = ids[order]
+        sorted_parts = self._partition_of(sorted_ids, self.n_partitions)
+        encoded = {c["name"]: self._encode(df[c["name"]], c)[order] for c in schema}
+
+        partitions = {}
+        stats = {"written": 0, "unchanged": 0, "removed": 0}
+
+        # stable sort by partition keeps ids sorted inside each partition
+        by_part = np.argsort(sorted_parts, kind="stable")
+        bounds = np.searchsorted(sorted_parts[by_part], np.arange(self.n_partitions + 1))
+
+        for pid in range(self.n_partitions):
+            rows = by_part[bounds[pid]:bounds[pid + 1]]
+            if len(rows) == 0:
+                if str(pid) in old_parts:
+                    stats["removed"] += 1
+                continue
+
+            arrays = {INDEX_FILE: sorted_ids[rows]}
+            arrays.update({name: values[rows] for name, values in encoded.items()})
+            checksum = self._checksum(arrays, schema)
+
+            old = old_parts.get(str(pid))
+            if old and old["checksum"] == checksum:
+                partitions[str(pid)] = old
+                stats["unchanged"] += 1
+                continue
+
+            part_dir = f"part_{pid:04d}_{uuid.uuid4().hex[:8]}"
+            (self.root_dir / part_dir).mkdir()
+            for name, values in arrays.items():
+                file_name = name if name == INDEX_FILE else f"{name}.npy"
+                np.save(self.root_dir / part_dir / file_name, values)
+
+            partitions[str(pid)] = {"dir": part_dir, "rows": int(len(rows)), "checksum": checksum}
+            stats["written"] += 1
+
+        self._write_manifest({
+            "key": self.key,
+            "n_partitions": self.n_partitions,
+            "n_rows": int(len(ids)),
+            "columns": schema,
+            "partitions": partitions,
+        })
+
+        # the generation this build replaced stays on disk so readers still on
+        # the old manifest can finish; anything older (N-2 and orphans) goes
+        keep = {p["dir"] for p in partitions.values()}
+        if current:
+            keep |= {p["dir"] for p in current["partitions"].values()}
+        for part_dir in self.root_dir.glob("part_*"):
+            if part_dir.name not in keep:
+                shutil.rmtree(part_dir, ignore_errors=True)
+
+        self.refresh()
+        return stats
+
+    def _partition(self, pid: int) -> Optional[Dict[str, np.ndarray]]:
+        if pid not in self._open_partitions:
+            info = self.manifest["partitions"].get(str(pid))
+            if info is None:
+                self._open_partitions[pid] = None
+            else:
+                part_dir = self.root_dir / info["dir"]
+                arrays = {INDEX_FILE: np.load(part_dir / INDEX_FILE, mmap_mode="r")}
+                for name in self.columns:
+                    arrays[name] = np.load(part_dir / f"{name}.npy", mmap_mode="r")
+                self._open_partitions[pid] = arrays
+        return self._open_partitions[pid]
+
+    def lookup(self, ids, columns: Optional[List[str]] = None) -> DataFrame:
+        # long-lived readers pick up a rebuild on their next lookup
+        self.refresh_if_changed()
+        if self.manifest is None:
+            raise ValueError(f"Feature store is empty: {self.root_dir}")
+
+        ids = np.atleast_1d(np.asarray(ids, dtype=np.int64))
+        columns = columns or self.columns
+        specs = {c["name"]: c for c in self.manifest["columns"]}
+
+        out = {}
+        for name in columns:
+            if specs[name]["dtype"] == "category":
+                out[name] = np.full(len(ids), -1, dtype=np.int32)
+            else:
+                out[name] = np.empty(len(ids), dtype=specs[name]["dtype"])
+        found = np.zeros(len(ids), dtype=bool)
+
+        parts = self._partition_of(ids, self.manifest["n_partitions"])
+        for pid in np.unique(parts):
+            arrays = self._partition(int(pid))
+            if arrays is None:
+                continue
+
+            positions = np.flatnonzero(parts == pid)
+            index = arrays[INDEX_FILE]
+            loc = np.searchsorted(index, ids[positions])
+            loc_clipped = np.minimum(loc, len(index) - 1)
+            hit = index[loc_clipped] == ids[positions]
+
+            positions, rows = positions[hit], loc_clipped[hit]
+            found[positions] = True
+            for name in columns:
+                out[name][positions] = arrays[name][rows]
+
+        if not found.all():
+            missing = ids[~found]
+            raise KeyError(f"{len(missing)} {self.key} value(s) not in feature store, e.g. {missing[:5].tolist()}")
+
+        frame = {self.key: ids}
+        for name in columns:
+            if specs[name]["dtype"] == "category":
+                frame[name] = pd.Categorical.from_codes(out[name], categories=specs[name]["categories"])
+            else:
+                frame[name] = out[name]
+
+        return DataFrame(frame)
+
+    def get(self, customer_id, columns: Optional[List[str]] = None) -> pd.Series:
+        return self.lookup([customer_id], columns).iloc[0]
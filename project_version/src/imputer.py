@@ -0,0 +1,96 @@
+# src/features/imputer.py
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class FeatureImputer:
+    def __init__(self, strategy: Optional[Dict[str, Any]] = None):
+        # strategy = {"default_numeric": "median", "default_categorical": "mode",
+        #             "columns": {<col>: "median" | "mode" | {"strategy": "constant", "fill_value": v}}}
+        self.strategy = strategy or {}
+        self.numeric_cols = []
+        self.numeric_fill = np.array([], dtype=np.float64)
+        self.other_fill: Dict[str, Any] = {}
+
+    def _column_strategy(self, col: str, numeric: bool) -> Dict[str, Any]:
+        default = self.strategy.get("default_numeric" if numeric else "default_categorical",
+                                    "median" if numeric else "mode")
+        spec = self.strategy.get("columns", {}).get(col, default)
+        if isinstance(spec, str):
+            spec = {"strategy": spec}
+        if spec["strategy"] not in ("median", "mode", "constant"):
+            raise ValueError(f"Unknown imputation strategy for '{col}': {spec['strategy']}")
+        if spec["strategy"] == "median" and not numeric:
+            raise ValueError(f"Median imputation requested for non-numeric column '{col}'")
+        return spec
+
+    def fit(self, df: pd.DataFrame):
+        numeric = [c for c in df.columns
+                   if pd.api.types.is_numeric_dtype(df[c]) and not pd.api.types.is_bool_dtype(df[c])]
+        specs = {c: self._column_strategy(c, c in numeric) for c in df.columns}
+
+        self.numeric_cols = numeric
+        fill = np.full(len(numeric), np.nan)
+
+        # all numeric medians in one pass over the block
+        median_idx = [i for i, c in enumerate(numeric) if specs[c]["strategy"] == "median"]
+        if median_idx:
+            block = df[[numeric[i] for i in median_idx]].to_numpy(dtype=np.float64, na_value=np.nan)
+            with np.errstate(all="ignore"):
+                fill[median_idx] = np.nanmedian(block, axis=0) if len(block) else np.nan
+
+        for i, col in enumerate(numeric):
+            spec = specs[col]
+            if spec["strategy"] == "mode":
+                mode = df[col].mode(dropna=True)
+                fill[i] = mode.iloc[0] if len(mode) else np.nan
+            elif spec["strategy"] == "constant":
+                fill[i] = spec.get("fill_value", 0)
+
+        # a column with no observed values at all falls back to 0
+        self.numeric_fill = np.where(np.isnan(fill), 0.0, fill)
+
+        self.other_fill = {}
+        for col in df.columns:
+            if col in numeric:
+                continue
+            spec = specs[col]
+            if spec["strategy"] == "constant":
+                self.other_fill[col] = spec.get("fill_value", "missing")
+            else:
+                mode = df[col].mode(dropna=True)
+                self.other_fill[col] = mode.iloc[0] if len(mode) else "missing"
+
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        present = [i for i, c in enumerate(self.numeric_cols) if c in df.columns]
+        cols = [self.numeric_cols[i] for i in present]
+        fill = self.numeric_fill[present]
+
+        parts = []
+        if cols:
+            # one copy of the numeric block, filled in place via the NaN coordinates
+            block = df[cols].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+            rows, idx = np.nonzero(np.isnan(block))
+            block[rows, idx] = fill[idx]
+            parts.append(pd.DataFrame(block, columns=cols, index=df.index))
+
+        rest = df.drop(columns=cols)
+        other_fill = {c: v for c, v in self.other_fill.items() if c in rest.columns}
+        if other_fill:
+            rest = rest.fillna(other_fill)
+        parts.append(rest)
+
+        return pd.concat(parts, axis=1)[df.columns]
+
+    def fit_transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        return self.fit(df).transform(df)
+
+    def fill_values(self) -> Dict[str, Any]:
+        values = dict(zip(self.numeric_cols, self.numeric_fill.tolist()))
+        values.update(self.other_fill)
+        return values
@@ -0,0 +1,115 @@
+# src/key_integrity.py
+
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+AGGREGATIONS = {"latest", "first", "sum", "count", "max", "min", "mean"}
+
+
+class DuplicateKeyError(ValueError):
+    def __init__(self, source: str, key: str, stats: Dict[str, Any]):
+        self.source = source
+        self.key = key
+        self.stats = stats
+        super().__init__(
+            f"Source '{source}' has {stats['duplicate_rows']} duplicate rows over "
+            f"{stats['duplicated_keys']} {key} values (max {stats['max_rows_per_key']} rows per key, "
+            f"fan-out {stats['fan_out']:.2f}) and its policy is 'reject'; declare an "
+            f"aggregation for it in KEY_INTEGRITY_POLICY or fix the source"
+        )
+
+
+class KeyIntegrityChecker:
+    def __init__(self, policy: Optional[Dict[str, Any]] = None):
+        # policy = {"default": "reject" | "aggregate",
+        #           "sources": {<file stem>: {"on_duplicates": ..., "order_by": <col>,
+        #                                     "aggregations": {<col>: <agg>},
+        #                                     "default_aggregation": "latest"}}}
+        self.policy = policy or {}
+        self.report: Dict[str, Dict[str, Any]] = {}
+
+    def _source_policy(self, source: str) -> Dict[str, Any]:
+        source_policy = dict(self.policy.get("sources", {}).get(source, {}))
+        source_policy.setdefault("on_duplicates", self.policy.get("default", "reject"))
+        return source_policy
+
+    def profile(self, df: DataFrame, key: str) -> Dict[str, Any]:
+        keys = df[key]
+        null_keys = int(keys.isna().sum())
+
+        # factorize is a single hash-table pass; bincount of the codes gives rows per key
+        codes, uniques = pd.factorize(keys, use_na_sentinel=True)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+
+        rows = int(len(keys))
+        n_unique = int(len(uniques))
+
+        return {
+            "rows": rows,
+            "unique_keys": n_unique,
+            "null_keys": null_keys,
+            "duplicate_rows": int(rows - null_keys - n_unique),
+            "duplicated_keys": int((counts > 1).sum()),
+            "max_rows_per_key": int(counts.max()) if n_unique else 0,
+            "fan_out": float((rows - null_keys) / n_unique) if n_unique else 0.0,
+        }
+
+    def _aggregate(self, df: DataFrame, key: str, source_policy: Dict[str, Any]) -> DataFrame:
+        aggregations = source_policy.get("aggregations", {})
+        default = source_policy.get("default_aggregation", "latest")
+
+        unknown = {how for how in list(aggregations.values()) + [default] if how not in AGGREGATIONS}
+        if unknown:
+            raise ValueError(f"Unknown aggregation(s) {sorted(unknown)}; expected one of {sorted(AGGREGATIONS)}")
+
+        order_by = source_policy.get("order_by")
+        if order_by and order_by in df.columns:
+            df = df.sort_values(order_by, kind="stable")
+
+        columns = [c for c in df.columns if c != key]
+        plan = {c: aggregations.get(c, default) for c in columns}
+
+        latest = df.drop_duplicates(subset=key, keep="last").set_index(key)
+        first = None
+        if "first" in plan.values():
+            first = df.drop_duplicates(subset=key, keep="first").set_index(key)
+
+        grouped = df.groupby(key, sort=False)
+        result = latest[[]].copy()
+
+        for col in columns:
+            how = plan[col]
+            if how == "latest":
+                result[col] = latest[col]
+            elif how == "first":
+                result[col] = first[col]
+            else:
+                result[col] = grouped[col].agg(how)
+
+        return result.reset_index()
+
+    def resolve(self, df: DataFrame, key: str, source: str) -> Tuple[DataFrame, Dict[str, Any]]:
+        stats = self.profile(df, key)
+        source_policy = self._source_policy(source)
+
+        if stats["null_keys"]:
+            df = df[df[key].notna()]
+
+        if stats["duplicate_rows"] == 0:
+            stats["action"] = "unique"
+        elif source_policy["on_duplicates"] == "aggregate":
+            df = self._aggregate(df, key, source_policy)
+            stats["action"] = "aggregated"
+        else:
+            # training silently without a source would produce a different model
+            stats["action"] = "rejected"
+            stats["rows_after"] = 0
+            self.report[source] = stats
+            raise DuplicateKeyError(source, key, stats)
+
+        stats["rows_after"] = int(len(df))
+        self.report[source] = stats
+        return df, stats
@@ -0,0 +1,339 @@
+# src/models/model_compressor.py
+
+import json
+import pickle
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import joblib
+import numpy as np
+from scipy.stats import rankdata
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.metrics import roc_auc_score
+
+TREE_LEAF = -1
+
+
+def _rank_auc(scores: np.ndarray, y: np.ndarray) -> np.ndarray:
+    # Mann-Whitney AUC for every row of a (candidates x samples) score matrix
+    y = np.asarray(y).astype(bool)
+    n_pos = y.sum()
+    n_neg = len(y) - n_pos
+    ranks = rankdata(scores, axis=1)
+    return (ranks[:, y].sum(axis=1) - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg)
+
+
+def _float32_floor(threshold: np.ndarray) -> np.ndarray:
+    # sklearn compares float32 inputs against float64 thresholds; rounding a
+    # threshold down to float32 keeps every comparison identical
+    thr32 = threshold.astype(np.float32)
+    too_high = thr32.astype(np.float64) > threshold
+    thr32[too_high] = np.nextafter(thr32[too_high], np.float32(-np.inf))
+    return thr32
+
+
+class CompactForest:
+    def __init__(
+            self,
+            estimators: List,
+            max_depth: Optional[int] = None,
+            min_leaf_samples: int = 1,
+            quantization_bits: Optional[int] = 8
+    ):
+        self.max_depth = max_depth
+        self.min_leaf_samples = min_leaf_samples
+        self.quantization_bits = quantization_bits
+        self.n_features_in_ = estimators[0].n_features_in_
+        self.classes_ = np.array([0, 1])
+
+        features, thresholds, lefts, rights, nan_lefts, values, roots = [], [], [], [], [], [], []
+        offset = 0
+        depth_reached = 0
+
+        for estimator in estimators:
+            tree = estimator.tree_
+            class_index = list(estimator.classes_).index(1)
+            node_value = tree.value[:, 0, class_index] / tree.value[:, 0, :].sum(axis=1)
+            missing_left = getattr(tree, "missing_go_to_left", None)
+
+            # breadth-first copy of the tree, turning nodes into leaves once the
+            # depth limit is hit or a child would fall under min_leaf_samples
+            keep = [0]
+            depth = {0: 0}
+            new_id = {0: 0}
+            children = {}
+            i = 0
+            while i < len(keep):
+                node = keep[i]
+                i += 1
+                left, right = tree.children_left[node], tree.children_right[node]
+                is_split = (
+                    left != TREE_LEAF
+                    and (max_depth is None or depth[node] < max_depth)
+                    and min(tree.n_node_samples[left], tree.n_node_samples[right]) >= min_leaf_samples
+                )
+                if not is_split:
+                    continue
+                for child in (left, right):
+                    depth[child] = depth[node] + 1
+                    new_id[child] = len(keep)
+                    keep.append(child)
+                children[node] = (new_id[left], new_id[right])
+
+            keep = np.array(keep)
+            n = len(keep)
+            feature = np.full(n, TREE_LEAF, dtype=np.int16)
+            left_arr = np.full(n, TREE_LEAF, dtype=np.int32)
+            right_arr = np.full(n, TREE_LEAF, dtype=np.int32)
+            nan_left = np.zeros(n, dtype=bool)
+
+            for node, (l, r) in children.items():
+                j = new_id[node]
+                feature[j] = tree.feature[node]
+                left_arr[j] = l + offset
+                right_arr[j] = r + offset
+                if missing_left is not None:
+                    nan_left[j] = bool(missing_left[node])
+
+            features.append(feature)
+            thresholds.append(tree.threshold[keep])
+            lefts.append(left_arr)
+            rights.append(right_arr)
+            nan_lefts.append(nan_left)
+            values.append(node_value[keep])
+            roots.append(offset)
+
+            depth_reached = max(depth_reached, max(depth.values()))
+            offset += n
+
+        self.feature = np.concatenate(features)
+        self.threshold = _float32_floor(np.concatenate(thresholds))
+        self.children_left = np.concatenate(lefts)
+        self.children_right = np.concatenate(rights)
+        self.nan_left = np.concatenate(nan_lefts)
+        self.roots = np.array(roots, dtype=np.int32)
+        self.depth = depth_reached
+
+        value = np.concatenate(values)
+        if quantization_bits:
+            levels = (1 << quantization_bits) - 1
+            dtype = np.uint8 if quantization_bits <= 8 else np.uint16
+            self.value = np.round(value * levels).astype(dtype)
+            self.value_scale = 1.0 / levels
+        else:
+            self.value = value.astype(np.float32)
+            self.value_scale = 1.0
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    @property
+    def node_count(self) -> int:
+        return len(self.feature)
+
+    def predict_proba(self, X) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float32)
+        n = len(X)
+        rows = np.arange(n)[:, None]
+        node = np.broadcast_to(self.roots, (n, self.n_trees)).copy()
+
+        # all rows descend all trees together, one level per iteration
+        for _ in range(self.depth):
+            feature = self.feature[node]
+            internal = feature >= 0
+            if not internal.any():
+                break
+            x = X[rows, np.where(internal, feature, 0)]
+            go_left = (x <= self.threshold[node]) | (np.isnan(x) & self.nan_left[node])
+            node = np.where(internal, np.where(go_left, self.children_left[node], self.children_right[node]), node)
+
+        prob = self.value[node].astype(np.float64).mean(axis=1) * self.value_scale
+        return np.column_stack([1.0 - prob, prob])
+
+    def predict(self, X) -> np.ndarray:
+        return (self.predict_proba(X)[:, 1] >= 0.5).astype(np.int64)
+
+
+class DistilledClassifier:
+    def __init__(self, regressor):
+        self.regressor = regressor
+        self.classes_ = np.array([0, 1])
+        self.n_features_in_ = regressor.n_features_in_
+
+    def predict_proba(self, X) -> np.ndarray:
+        prob = np.clip(self.regressor.predict(X), 0.0, 1.0)
+        return np.column_stack([1.0 - prob, prob])
+
+    def predict(self, X) -> np.ndarray:
+        return (self.predict_proba(X)[:, 1] >= 0.5).astype(np.int64)
+
+
+class ModelCompressor:
+    def __init__(
+            self,
+            auc_budget: float = 0.005,
+            max_trees: int = 50,
+            depths: Optional[List[Optional[int]]] = None,
+            min_leaf_samples: int = 1,
+            quantization_bits: Optional[int] = 8,
+            distillation_params: Optional[List[Dict[str, Any]]] = None,
+            transfer_copies: int = 4,
+            transfer_noise: float = 0.1,
+            random_state: int = 42
+    ):
+        self.auc_budget = auc_budget
+        self.max_trees = max_trees
+        self.depths = depths or [6, 8, 10, 12, None]
+        self.min_leaf_samples = min_leaf_samples
+        self.quantization_bits = quantization_bits
+        self.distillation_params = distillation_params if distillation_params is not None else [
+            {"max_iter": 100, "max_depth": 3},
+            {"max_iter": 200, "max_depth": 4},
+        ]
+        self.transfer_copies = transfer_copies
+        self.transfer_noise = transfer_noise
+        self.random_state = random_state
+
+        self.selection_curve: List[float] = []
+        self.report: Dict[str, Any] = {}
+
+    def select_trees(self, model, X_val, y_val) -> List[int]:
+        # greedy forward ensemble selection (without replacement) on validation AUC
+        tree_proba = np.vstack([
+            est.predict_proba(np.asarray(X_val, dtype=np.float32))[:, list(est.classes_).index(1)]
+            for est in model.estimators_
+        ])
+
+        selected: List[int] = []
+        remaining = list(range(len(tree_proba)))
+        current = np.zeros(tree_proba.shape[1])
+        self.selection_curve = []
+
+        for _ in range(min(self.max_trees, len(remaining))):
+            aucs = _rank_auc(current + tree_proba[remaining], y_val)
+            best = int(np.argmax(aucs))
+            tree = remaining.pop(best)
+            selected.append(tree)
+            current += tree_proba[tree]
+            self.selection_curve.append(float(aucs[best]))
+
+        return selected
+
+    def transfer_set(self, X) -> np.ndarray:
+        # held-out rows plus jittered copies (noise in units of each feature's
+        # std); the forest has seen none of them, so its soft labels reflect how
+        # it generalizes rather than the training rows it memorized
+        X = np.asarray(X, dtype=np.float64)
+        rng = np.random.default_rng(self.random_state)
+        scale = self.transfer_noise * np.nanstd(X, axis=0)
+        copies = [X + rng.normal(size=X.shape) * scale for _ in range(self.transfer_copies)]
+        return np.vstack([X] + copies)
+
+    def distill(self, teacher, X_transfer, params: Dict[str, Any]) -> DistilledClassifier:
+        soft_labels = teacher.predict_proba(X_transfer)[:, 1]
+        regressor = HistGradientBoostingRegressor(random_state=self.random_state, **params)
+        regressor.fit(X_transfer, soft_labels)
+        return DistilledClassifier(regressor)
+
+    def _profile(self, model, X, y) -> Dict[str, float]:
+        start = time.perf_counter()
+        prob = model.predict_proba(X)[:, 1]
+        batch_seconds = time.perf_counter() - start
+
+        single = np.asarray(X[:1])
+        timings = []
+        for _ in range(20):
+            start = time.perf_counter()
+            model.predict_proba(single)
+            timings.append(time.perf_counter() - start)
+
+        return {
+            "auc": float(roc_auc_score(y, prob)),
+            "size_bytes": len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)),
+            "batch_us_per_row": batch_seconds / max(1, len(X)) * 1e6,
+            "single_row_ms": float(np.median(timings)) * 1e3,
+        }
+
+    def compress(self, model, X_val, y_val, X_eval, y_eval, X_transfer=None):
+        # X_val drives tree selection, prefix sizing and (by default) the
+        # distillation transfer set; the budget gate and every reported number
+        # use X_eval, which none of those choices have seen
+        X_val = np.asarray(X_val)
+        X_eval = np.asarray(X_eval)
+        if X_transfer is None:
+            X_transfer = self.transfer_set(X_val)
+
+        base_auc = float(roc_auc_score(y_val, model.predict_proba(X_val)[:, 1]))
+
+        candidates = {}
+        selected = self.select_trees(model, X_val, y_val)
+
+        # start from the smallest prefix of the greedy order that stays inside the
+        # budget and double up to the full selection; truncation costs some AUC
+        within = [i for i, auc in enumerate(self.selection_curve) if base_auc - auc <= self.auc_budget]
+        n_trees = (within[0] + 1) if within else len(selected)
+        sizes = []
+        while n_trees < len(selected):
+            sizes.append(n_trees)
+            n_trees *= 2
+        sizes.append(len(selected))
+
+        for n_trees in sizes:
+            trees = [model.estimators_[i] for i in selected[:n_trees]]
+            for depth in self.depths:
+                name = f"forest_{n_trees}trees_depth{depth or 'full'}"
+                candidates[name] = CompactForest(
+                    trees, max_depth=depth,
+                    min_leaf_samples=self.min_leaf_samples,
+                    quantization_bits=self.quantization_bits
+                )
+
+        for params in self.distillation_params:
+            name = "distilled_" + "_".join(f"{k}{v}" for k, v in params.items())
+            candidates[name] = self.distill(model, X_transfer, params)
+
+        original = self._profile(model, X_eval, y_eval)
+        self.report = {
+            "auc_budget": self.auc_budget,
+            "validation_auc_original": base_auc,
+            "selection_curve": self.selection_curve,
+            "transfer_rows": int(len(X_transfer)),
+            "original": original,
+            "candidates": {},
+        }
+
+        best_name, best_model = None, None
+        for name, candidate in candidates.items():
+            val_auc = float(roc_auc_score(y_val, candidate.predict_proba(X_val)[:, 1]))
+            stats = self._profile(candidate, X_eval, y_eval)
+            stats["auc_loss"] = original["auc"] - stats["auc"]
+            stats["within_budget"] = stats["auc_loss"] <= self.auc_budget
+            stats["validation_auc"] = val_auc
+            stats["validation_auc_loss"] = base_auc - val_auc
+            self.report["candidates"][name] = stats
+
+            if stats["within_budget"] and (
+                    best_name is None
+                    or stats["size_bytes"] < self.report["candidates"][best_name]["size_bytes"]
+            ):
+                best_name, best_model = name, candidate
+
+        self.report["selected"] = best_name
+        return best_model, self.report
+
+    def save_model(self, model, path: str) -> str:
+        path = Path(path)
+        path.parent.mkdir(exist_ok=True, parents=True)
+        joblib.dump(model, path)
+        return str(path)
+
+    def save_report(self, report: Dict, path: str) -> str:
+        path = Path(path)
+        path.parent.mkdir(exist_ok=True, parents=True)
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+        return str(path)
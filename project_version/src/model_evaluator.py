@@ -0,0 +1,233 @@
+# src/models/model_evaluator.py
+
+import json
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.metrics import accuracy_score, classification_report
+
+
+def _sort_by_score(y_true, y_prob):
+    y_true = np.asarray(y_true, dtype=np.float64).ravel()
+    y_prob = np.asarray(y_prob, dtype=np.float64).ravel()
+
+    order = np.argsort(-y_prob, kind="mergesort")
+    y_sorted = y_true[order]
+    p_sorted = y_prob[order]
+
+    # last index of every block of tied scores
+    distinct_idx = np.r_[np.flatnonzero(np.diff(p_sorted)), len(p_sorted) - 1]
+
+    return y_sorted, p_sorted, distinct_idx
+
+
+def _ranking_metrics(y_sorted, distinct_idx, weights=None) -> Dict[str, float]:
+    if weights is None:
+        pos_w = y_sorted
+        neg_w = 1.0 - y_sorted
+    else:
+        pos_w = weights * y_sorted
+        neg_w = weights * (1.0 - y_sorted)
+
+    tp = np.cumsum(pos_w)[distinct_idx]
+    fp = np.cumsum(neg_w)[distinct_idx]
+    n_pos, n_neg = tp[-1], fp[-1]
+
+    if n_pos == 0 or n_neg == 0:
+        return {"roc_auc": np.nan, "pr_auc": np.nan, "ks": np.nan, "gini": np.nan}
+
+    tpr = np.r_[0.0, tp / n_pos]
+    fpr = np.r_[0.0, fp / n_neg]
+    roc_auc = float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1])) / 2.0)
+
+    # average precision, same step-wise definition as sklearn
+    precision = tp / np.maximum(tp + fp, np.finfo(np.float64).tiny)
+    pr_auc = float(np.sum(np.diff(tpr) * precision))
+
+    return {
+        "roc_auc": roc_auc,
+        "pr_auc": pr_auc,
+        "ks": float(np.max(tpr - fpr)),
+        "gini": 2.0 * roc_auc - 1.0,
+    }
+
+
+def _bootstrap_chunk(y_sorted, distinct_idx, seed, n_rounds) -> List[Dict[str, float]]:
+    rng = np.random.default_rng(seed)
+    n = len(y_sorted)
+    results = []
+
+    # a resample is the multiset of drawn rows, so the rows stay in score order
+    # and only their multiplicities change - no re-sorting per round
+    for _ in range(n_rounds):
+        counts = np.bincount(rng.integers(0, n, n), minlength=n).astype(np.float64)
+        results.append(_ranking_metrics(y_sorted, distinct_idx, counts))
+
+    return results
+
+
+class ModelEvaluator:
+    METRICS = ["roc_auc", "pr_auc", "ks", "gini"]
+
+    def __init__(
+            self,
+            n_bootstrap: int = 200,
+            confidence: float = 0.95,
+            n_calibration_bins: int = 10,
+            n_lift_groups: int = 10,
+            n_jobs: int = -1,
+            random_state: int = 42
+    ):
+        self.n_bootstrap = n_bootstrap
+        self.confidence = confidence
+        self.n_calibration_bins = n_calibration_bins
+        self.n_lift_groups = n_lift_groups
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+
+    def evaluate(self, y_true, y_prob) -> Dict:
+        y_sorted, p_sorted, distinct_idx = _sort_by_score(y_true, y_prob)
+
+        metrics = _ranking_metrics(y_sorted, distinct_idx)
+
+        report = {
+            "n_rows": int(len(y_sorted)),
+            "n_events": int(y_sorted.sum()),
+            "event_rate": float(y_sorted.mean()) if len(y_sorted) else np.nan,
+            "metrics": metrics,
+            "calibration": self.calibration_table(y_sorted, p_sorted),
+            "lift": self.lift_table(y_sorted),
+        }
+
+        if self.n_bootstrap > 0:
+            report["confidence_intervals"] = self.bootstrap_ci(y_sorted, distinct_idx)
+
+        return report
+
+    def classification_summary(self, y_true, y_prob, threshold: float = 0.5) -> Dict:
+        # strict ">" matches the forest's argmax predict, so accuracy and the
+        # report come from the same predict_proba pass as the ranking metrics
+        y_pred = (np.asarray(y_prob) > threshold).astype(np.int64)
+        return {
+            "accuracy": accuracy_score(y_true, y_pred),
+            "report": classification_report(y_true, y_pred, output_dict=False, zero_division=0)
+        }
+
+    def evaluate_model(self, model, X_test, y_test) -> Dict:
+        y_prob = model.predict_proba(X_test)[:, 1]
+        return self.evaluate(y_test, y_prob)
+
+    def bootstrap_ci(self, y_sorted, distinct_idx) -> Dict[str, Dict[str, float]]:
+        n_chunks = min(self.n_bootstrap, 32)
+        rounds = np.full(n_chunks, self.n_bootstrap // n_chunks)
+        rounds[: self.n_bootstrap % n_chunks] += 1
+
+        seeds = np.random.SeedSequence(self.random_state).spawn(n_chunks)
+
+        chunks = Parallel(n_jobs=self.n_jobs)(
+            delayed(_bootstrap_chunk)(y_sorted, distinct_idx, seed, int(n_rounds))
+            for seed, n_rounds in zip(seeds, rounds)
+        )
+        samples = [row for chunk in chunks for row in chunk]
+
+        alpha = (1.0 - self.confidence) / 2.0
+        intervals = {}
+
+        for name in self.METRICS:
+            values = np.array([row[name] for row in samples], dtype=np.float64)
+            values = values[~np.isnan(values)]
+
+            if len(values) == 0:
+                intervals[name] = {"lower": np.nan, "upper": np.nan, "std": np.nan}
+                continue
+
+            lower, upper = np.quantile(values, [alpha, 1.0 - alpha])
+            intervals[name] = {
+                "lower": float(lower),
+                "upper": float(upper),
+                "std": float(values.std(ddof=1)) if len(values) > 1 else 0.0,
+            }
+
+        return intervals
+
+    def calibration_table(self, y_true, y_prob) -> List[Dict[str, float]]:
+        n_bins = self.n_calibration_bins
+        bins = np.clip((np.asarray(y_prob) * n_bins).astype(np.int64), 0, n_bins - 1)
+
+        count = np.bincount(bins, minlength=n_bins)
+        prob_sum = np.bincount(bins, weights=y_prob, minlength=n_bins)
+        event_sum = np.bincount(bins, weights=y_true, minlength=n_bins)
+
+        table = []
+        for b in range(n_bins):
+            if count[b] == 0:
+                continue
+            table.append({
+                "bin_lower": b / n_bins,
+                "bin_upper": (b + 1) / n_bins,
+                "count": int(count[b]),
+                "mean_predicted": float(prob_sum[b] / count[b]),
+                "observed_rate": float(event_sum[b] / count[b]),
+            })
+
+        return table
+
+    def lift_table(self, y_sorted) -> List[Dict[str, float]]:
+        n = len(y_sorted)
+        n_groups = min(self.n_lift_groups, n)
+        total_events = y_sorted.sum()
+
+        if n_groups == 0 or total_events == 0:
+            return []
+
+        # rows are already sorted by descending score, so groups are positional
+        groups = (np.arange(n) * n_groups) // n
+        count = np.bincount(groups, minlength=n_groups)
+        events = np.bincount(groups, weights=y_sorted, minlength=n_groups)
+
+        overall_rate = total_events / n
+        cum_count = np.cumsum(count)
+        cum_events = np.cumsum(events)
+
+        table = []
+        for g in range(n_groups):
+            rate = events[g] / count[g]
+            table.append({
+                "group": g + 1,
+                "count": int(count[g]),
+                "events": int(events[g]),
+                "event_rate": float(rate),
+                "lift": float(rate / overall_rate),
+                "cumulative_population": float(cum_count[g] / n),
+                "cumulative_gain": float(cum_events[g] / total_events),
+                "cumulative_lift": float((cum_events[g] / cum_count[g]) / overall_rate),
+            })
+
+        return table
+
+    def save_report(self, report: Dict, path: str) -> str:
+        path = Path(path)
+        path.parent.mkdir(exist_ok=True, parents=True)
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(_json_safe(report), f, indent=2, allow_nan=False)
+
+        return str(path)
+
+
+def _json_safe(value):
+    # undefined metrics (single-class split, all-NaN bootstrap) are NaN; JSON
+    # has no NaN literal, so they are written as null
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return _json_safe(value.tolist())
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
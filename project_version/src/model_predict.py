@@ -1,22 +1,151 @@
 # src/models/model_predict.py
 
+import os
+
 import joblib
+import numpy as np
 import pandas as pd
 
+from src.drift_monitor import DriftMonitor
+from src.feature_store import FeatureStore
+from src.model_explainer import ModelExplainer
+from src.prediction_cache import DEFAULT_MAX_SIZE, PredictionCache, model_version, row_keys
+
 
 class ModelPredictor:
-    def __init__(self, model_path="model_rf.pkl", scaler_path="scaler.pkl"):
-        self.model = joblib.load(model_path)
-        self.scaler = joblib.load(scaler_path)
+    def __init__(
+            self,
+            model_path="model_rf.pkl",
+            scaler_path="scaler.pkl",
+            imputer_path=None,
+            drift_profile_path=None,
+            cache_size=0,
+            cache_path=None,
+            feature_store_path=None
+    ):
+        self.model_path = model_path
+        self.scaler_path = scaler_path
+        self.imputer_path = imputer_path
+        self.artifact_paths = [p for p in (model_path, scaler_path, imputer_path) if p]
+        self._load_artifacts()
+
+        self.drift_profile_path = drift_profile_path
+        self.drift_monitor = DriftMonitor.load(drift_profile_path) if drift_profile_path else None
+
+        self.feature_store = FeatureStore(feature_store_path) if feature_store_path else None
+
+        self.cache = None
+        if cache_size or cache_path:
+            self.cache = PredictionCache(
+                self.version,
+                max_size=cache_size or DEFAULT_MAX_SIZE,
+                db_path=cache_path
+            )
+
+    def _stat(self):
+        return tuple((os.stat(p).st_mtime_ns, os.stat(p).st_size) for p in self.artifact_paths)
+
+    def _load_artifacts(self):
+        # model, scaler and imputer are saved together by main.py and are only
+        # ever swapped as one set, under one content-hash version
+        self._artifact_stat = self._stat()
+        self.model = joblib.load(self.model_path)
+        self.scaler = joblib.load(self.scaler_path)
+        self.imputer = joblib.load(self.imputer_path) if self.imputer_path else None
+        self.version = model_version(self.artifact_paths)
+        self.explainers = {}
+
+    def reload_if_changed(self):
+        # a retrain rewrites the whole set; a new version invalidates the cache
+        if self._stat() == self._artifact_stat:
+            return False
+
+        self._load_artifacts()
+        if self.drift_profile_path:
+            self.drift_monitor = DriftMonitor.load(self.drift_profile_path)
+        if self.cache is not None:
+            self.cache.set_version(self.version)
+        return True
 
     def preprocess(self, df):
+        if self.imputer is not None:
+            df = self.imputer.transform(df)
         return self.scaler.transform(df)
 
     def predict(self, df):
-        X = self.preprocess(df)
-        preds = self.model.predict(X)
-        return preds
+        # same path as predict_proba, so the cache and drift monitor see every batch;
+        # strict ">" matches the forest's argmax predict
+        proba = self.predict_proba(df)
+        return (proba[:, 1] > 0.5).astype(np.int64)
+
+    def _cached_predict_proba(self, X):
+        keys = row_keys(X)
+        prob, hit = self.cache.get_many(keys)
+
+        if not hit.all():
+            miss = ~hit
+            prob[miss] = self.model.predict_proba(X[miss])[:, 1]
+            self.cache.put_many(keys[miss], prob[miss])
+
+        return np.column_stack([1.0 - prob, prob])
+
+    def _score(self, df, X):
+        if self.cache is not None:
+            proba = self._cached_predict_proba(np.asarray(X))
+        else:
+            proba = self.model.predict_proba(X)
+
+        if self.drift_monitor is not None:
+            self.drift_monitor.update(df, scores=proba[:, 1])
+
+        return proba
 
     def predict_proba(self, df):
+        self.reload_if_changed()
         X = self.preprocess(df)
-        return self.model.predict_proba(X)
\ No newline at end of file
+        return self._score(df, X)
+
+    def features_for(self, customer_ids):
+        if self.feature_store is None:
+            raise ValueError("ModelPredictor was created without a feature_store_path")
+        self.reload_if_changed()
+        columns = list(self.scaler.feature_names_in_)
+        return self.feature_store.lookup(customer_ids, columns=columns)[columns]
+
+    def predict_proba_by_id(self, customer_ids):
+        return self.predict_proba(self.features_for(customer_ids))
+
+    def get_explainer(self, method="treeshap", **kwargs):
+        if method not in self.explainers:
+            self.explainers[method] = ModelExplainer(self.model, method=method, **kwargs)
+        return self.explainers[method]
+
+    def predict_with_reasons(self, df, top_k=4, method="treeshap", **kwargs):
+        # exact treeshap codes by default, about 0.3 s per row per CPU in batches
+        # on the default 200-tree forest; pass method="saabas" for the
+        # approximate codes when per-request latency matters more than exactness
+        self.reload_if_changed()
+        X = self.preprocess(df)
+        proba = self._score(df, X)
+
+        explainer = self.get_explainer(method, **kwargs)
+        feature_names = list(df.columns) if isinstance(df, pd.DataFrame) else None
+        reasons = explainer.reason_codes(X, top_k=top_k, feature_names=feature_names)
+
+        result = pd.DataFrame({"prob": proba[:, 1]}, index=getattr(df, "index", None))
+        reasons.index = result.index
+        return pd.concat([result, reasons], axis=1)
+
+    def cache_metrics(self):
+        if self.cache is None:
+            return {}
+        return self.cache.metrics()
+
+    def drift_report(self):
+        if self.drift_monitor is None:
+            return {}
+        return self.drift_monitor.report()
+
+    def save_drift_state(self, path=None):
+        if self.drift_monitor is not None:
+            self.drift_monitor.save(path or self.drift_profile_path)
@@ -0,0 +1,154 @@
+# src/prediction_cache.py
+
+import hashlib
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# two independent 64-bit row hashes give a 128-bit key
+HASH_KEYS = ("cbu-predcache-k1", "cbu-predcache-k2")
+SQLITE_MAX_PARAMS = 900
+DEFAULT_MAX_SIZE = 1_000_000
+
+
+def model_version(paths: Union[str, Sequence[str]], chunk_size: int = 1 << 20) -> str:
+    # one version for the whole artifact set (model + scaler + imputer)
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(chunk_size), b""):
+                digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def row_keys(X) -> np.ndarray:
+    frame = pd.DataFrame(np.ascontiguousarray(X, dtype=np.float64))
+    hashes = np.stack(
+        [pd.util.hash_pandas_object(frame, index=False, hash_key=key).to_numpy() for key in HASH_KEYS],
+        axis=1
+    )
+    return np.ascontiguousarray(hashes).view("V16").ravel()
+
+
+class PredictionCache:
+    def __init__(self, version: str, max_size: int = DEFAULT_MAX_SIZE, db_path: Optional[str] = None):
+        self.version = version
+        self.max_size = max_size
+        self.db_path = db_path
+
+        self.memory: "OrderedDict[bytes, float]" = OrderedDict()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+        self.conn = None
+        if db_path:
+            Path(db_path).parent.mkdir(exist_ok=True, parents=True)
+            self.conn = sqlite3.connect(str(db_path))
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS predictions ("
+                "version TEXT NOT NULL, key BLOB NOT NULL, prob REAL NOT NULL, "
+                "PRIMARY KEY (version, key)) WITHOUT ROWID"
+            )
+            self._purge_stale_versions()
+
+    def _purge_stale_versions(self):
+        self.conn.execute("DELETE FROM predictions WHERE version != ?", (self.version,))
+        self.conn.commit()
+
+    def set_version(self, version: str):
+        if version == self.version:
+            return
+        self.version = version
+        self.memory.clear()
+        if self.conn is not None:
+            self._purge_stale_versions()
+
+    def _remember(self, key: bytes, prob: float):
+        self.memory[key] = prob
+        self.memory.move_to_end(key)
+        if len(self.memory) > self.max_size:
+            self.memory.popitem(last=False)
+
+    def _disk_lookup(self, keys) -> Dict[bytes, float]:
+        found = {}
+        for start in range(0, len(keys), SQLITE_MAX_PARAMS):
+            batch = keys[start:start + SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            rows = self.conn.execute(
+                f"SELECT key, prob FROM predictions WHERE version = ? AND key IN ({placeholders})",
+                (self.version, *batch)
+            )
+            found.update(rows)
+        return found
+
+    def get_many(self, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        keys = keys.tolist()
+        probs = np.full(len(keys), np.nan)
+        hit = np.zeros(len(keys), dtype=bool)
+
+        missing = []
+        for i, key in enumerate(keys):
+            prob = self.memory.get(key)
+            if prob is None:
+                missing.append(i)
+            else:
+                self.memory.move_to_end(key)
+                probs[i] = prob
+                hit[i] = True
+
+        self.stats["memory_hits"] += len(keys) - len(missing)
+
+        if missing and self.conn is not None:
+            found = self._disk_lookup([keys[i] for i in missing])
+            for i in missing:
+                prob = found.get(keys[i])
+                if prob is not None:
+                    probs[i] = prob
+                    hit[i] = True
+                    self._remember(keys[i], prob)
+                    self.stats["disk_hits"] += 1
+
+        self.stats["misses"] += int((~hit).sum())
+        return probs, hit
+
+    def put_many(self, keys: np.ndarray, probs: np.ndarray):
+        keys = keys.tolist()
+        probs = np.asarray(probs, dtype=np.float64).tolist()
+
+        for key, prob in zip(keys, probs):
+            self._remember(key, prob)
+
+        if self.conn is not None and keys:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO predictions (version, key, prob) VALUES (?, ?, ?)",
+                ((self.version, key, prob) for key, prob in zip(keys, probs))
+            )
+            self.conn.commit()
+
+    def metrics(self) -> Dict[str, float]:
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+        total = hits + self.stats["misses"]
+        return {
+            **self.stats,
+            "hits": hits,
+            "lookups": total,
+            "hit_rate": hits / total if total else 0.0,
+            "memory_size": len(self.memory),
+        }
+
+    def clear(self):
+        self.memory.clear()
+        if self.conn is not None:
+            self.conn.execute("DELETE FROM predictions")
+            self.conn.commit()
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
@@ -0,0 +1,296 @@
+# src/schema_contracts.py
+
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pandas import DataFrame
+
+DTYPES = {"numeric", "integer", "string"}
+MAX_EXAMPLES = 5
+
+
+def _to_numeric(series: pd.Series) -> pd.Series:
+    # raw exports carry "$1,234.50" style values; those still count as numeric
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype(np.float64)
+    text = series.astype("string").str.replace(r'[\$,"\s]', "", regex=True)
+    return pd.to_numeric(text, errors="coerce").astype(np.float64)
+
+
+def _normalize(series: pd.Series) -> pd.Series:
+    return series.astype("string").str.strip().str.lower()
+
+
+class SchemaContractError(ValueError):
+    def __init__(self, source: str, path: str, violations: List[Dict[str, Any]]):
+        self.source = source
+        self.path = path
+        self.violations = violations
+
+        lines = [f"Schema contract failed for '{source}' ({path}):"]
+        for v in violations:
+            line = f"  - {v['column']}: {v['check']} {v['detail']}"
+            if "failed" in v:
+                line += f" ({v['failed']} of {v['checked']} checked rows"
+                if v.get("rows"):
+                    line += f", e.g. rows {v['rows']} -> {v['examples']}"
+                line += ")"
+            lines.append(line)
+        super().__init__("\n".join(lines))
+
+
+class CompiledContract:
+    def __init__(self, source: str, spec: Dict[str, Any]):
+        # spec = {"key": <id column>, "unique_key": bool, "required": [...],
+        #         "dtypes": {<col>: "numeric" | "integer" | "string"},
+        #         "ranges": {<col>: [min | None, max | None]},
+        #         "categories": {<col>: [...]}}   (case and padding insensitive)
+        self.source = source
+        self.key = spec.get("key")
+        self.unique_key = bool(spec.get("unique_key", False))
+        self.dtypes = dict(spec.get("dtypes", {}))
+        self.ranges = {c: tuple(bounds) for c, bounds in spec.get("ranges", {}).items()}
+        self.categories = {c: [str(v).strip().lower() for v in values]
+                           for c, values in spec.get("categories", {}).items()}
+
+        unknown = {d for d in self.dtypes.values() if d not in DTYPES}
+        if unknown:
+            raise ValueError(f"Unknown dtype(s) {sorted(unknown)} in contract '{source}'; "
+                             f"expected one of {sorted(DTYPES)}")
+
+        required = list(spec.get("required", []))
+        if self.key and self.key not in required:
+            required.insert(0, self.key)
+        self.required = required
+
+        self.checks = self._compile()
+
+    def _compile(self) -> List[Tuple[str, str, str, Callable[[pd.Series], np.ndarray]]]:
+        # each check maps a column to a boolean mask of offending rows
+        checks = []
+
+        for col, dtype in self.dtypes.items():
+            if dtype == "numeric":
+                checks.append((col, "dtype", "expected numeric",
+                               lambda s: (s.notna() & _to_numeric(s).isna()).to_numpy()))
+            elif dtype == "integer":
+                def bad_integer(s):
+                    values = _to_numeric(s)
+                    return (s.notna() & (values.isna() | (values % 1 != 0))).to_numpy()
+                checks.append((col, "dtype", "expected integer", bad_integer))
+
+        for col, (low, high) in self.ranges.items():
+            def out_of_range(s, low=low, high=high):
+                values = _to_numeric(s).to_numpy()
+                bad = np.zeros(len(values), dtype=bool)
+                with np.errstate(invalid="ignore"):
+                    if low is not None:
+                        bad |= values < low
+                    if high is not None:
+                        bad |= values > high
+                return bad
+            checks.append((col, "range", f"expected within [{low}, {high}]", out_of_range))
+
+        for col, allowed in self.categories.items():
+            allowed_index = pd.Index(allowed)
+            checks.append((col, "category", f"expected one of {allowed}",
+                           lambda s, allowed_index=allowed_index:
+                           (s.notna() & ~_normalize(s).isin(allowed_index)).to_numpy()))
+
+        if self.key:
+            checks.append((self.key, "key_not_null", "expected no missing keys",
+                           lambda s: s.isna().to_numpy()))
+            if self.unique_key:
+                checks.append((self.key, "key_unique", "expected unique keys",
+                               lambda s: (s.notna() & s.duplicated(keep=False)).to_numpy()))
+
+        return checks
+
+    @property
+    def columns(self) -> List[str]:
+        referenced = self.required + [col for col, _, _, _ in self.checks]
+        return list(dict.fromkeys(referenced))
+
+    def check_columns(self, columns) -> List[Dict[str, Any]]:
+        present = set(columns)
+        return [
+            {"column": col, "check": "required", "detail": "column is missing"}
+            for col in self.columns if col not in present
+        ]
+
+    def check_arrow_schema(self, schema: pa.Schema) -> Tuple[List[Dict[str, Any]], set]:
+        # metadata-only pass; returns violations plus the columns still needing data
+        violations = self.check_columns(schema.names)
+        needs_data = set()
+
+        for col, dtype in self.dtypes.items():
+            if col not in schema.names:
+                continue
+            arrow_type = schema.field(col).type
+            if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+                if dtype != "string":
+                    needs_data.add(col)
+            elif dtype == "integer" and not (pa.types.is_integer(arrow_type) or pa.types.is_boolean(arrow_type)):
+                if pa.types.is_floating(arrow_type) or pa.types.is_decimal(arrow_type):
+                    needs_data.add(col)
+                else:
+                    violations.append({"column": col, "check": "dtype",
+                                       "detail": f"expected integer, file stores {arrow_type}"})
+            elif dtype == "numeric" and not (
+                    pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)
+                    or pa.types.is_decimal(arrow_type) or pa.types.is_boolean(arrow_type)
+            ):
+                violations.append({"column": col, "check": "dtype",
+                                   "detail": f"expected numeric, file stores {arrow_type}"})
+
+        for col in self.categories:
+            needs_data.add(col)
+        if self.key and self.unique_key:
+            needs_data.add(self.key)
+
+        return violations, needs_data
+
+    def check_statistics(self, metadata: pq.FileMetaData, schema: pa.Schema) -> Tuple[List[Dict[str, Any]], set]:
+        # row-group min/max and null counts settle numeric ranges and key
+        # completeness without touching the data pages
+        violations = []
+        needs_data = set()
+        positions = {metadata.schema.column(i).name: i for i in range(metadata.num_columns)}
+
+        for col, (low, high) in self.ranges.items():
+            if col not in positions:
+                continue
+            arrow_type = schema.field(col).type
+            if not (pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)):
+                needs_data.add(col)
+                continue
+
+            col_min, col_max = np.inf, -np.inf
+            for rg in range(metadata.num_row_groups):
+                stats = metadata.row_group(rg).column(positions[col]).statistics
+                if stats is None or not stats.has_min_max:
+                    needs_data.add(col)
+                    break
+                col_min, col_max = min(col_min, stats.min), max(col_max, stats.max)
+            else:
+                if (low is not None and col_min < low) or (high is not None and col_max > high):
+                    violations.append({"column": col, "check": "range",
+                                       "detail": f"expected within [{low}, {high}], "
+                                                 f"row-group statistics span [{col_min}, {col_max}]"})
+
+        if self.key in positions:
+            null_keys = 0
+            for rg in range(metadata.num_row_groups):
+                stats = metadata.row_group(rg).column(positions[self.key]).statistics
+                if stats is None or not stats.has_null_count:
+                    needs_data.add(self.key)
+                    break
+                null_keys += stats.null_count
+            else:
+                if null_keys:
+                    violations.append({"column": self.key, "check": "key_not_null",
+                                       "detail": f"expected no missing keys, row-group statistics count {null_keys}"})
+
+        return violations, needs_data
+
+    def check_frame(self, df: DataFrame, columns: Optional[set] = None) -> List[Dict[str, Any]]:
+        violations = []
+        for col, check, detail, fn in self.checks:
+            if col not in df.columns or (columns is not None and col not in columns):
+                continue
+            bad = fn(df[col])
+            failed = int(bad.sum())
+            if failed:
+                rows = np.flatnonzero(bad)[:MAX_EXAMPLES]
+                violations.append({
+                    "column": col,
+                    "check": check,
+                    "detail": detail,
+                    "failed": failed,
+                    "checked": int(len(df)),
+                    "rows": rows.tolist(),
+                    "examples": df[col].iloc[rows].tolist(),
+                })
+        return violations
+
+
+class SchemaContractValidator:
+    def __init__(self, contracts: Optional[Dict[str, Dict[str, Any]]] = None, sample_rows: int = 10_000):
+        self.sample_rows = sample_rows
+        self.contracts = {source: CompiledContract(source, spec) for source, spec in (contracts or {}).items()}
+        self.report: Dict[str, Dict[str, Any]] = {}
+
+    def _read_head(self, path: Path) -> DataFrame:
+        suffix = path.suffix
+        if suffix == ".xlsx":
+            return pd.read_excel(path, nrows=self.sample_rows)
+        if suffix == ".jsonl":
+            return pd.read_json(path, lines=True, nrows=self.sample_rows)
+        if suffix == ".xml":
+            return self._read_xml_head(path)
+        return pd.read_csv(path, nrows=self.sample_rows)
+
+    def _read_xml_head(self, path: Path) -> DataFrame:
+        # stream only the first sample_rows record elements of <root><row>...</row></root>
+        records = []
+        depth = 0
+        for event, elem in ET.iterparse(path, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 1:
+                records.append({child.tag: child.text for child in elem})
+                elem.clear()
+                if len(records) >= self.sample_rows:
+                    break
+        return DataFrame(records)
+
+    def _validate_parquet(self, contract: CompiledContract, path: Path) -> Tuple[List[Dict[str, Any]], str]:
+        parquet_file = pq.ParquetFile(path)
+        schema = parquet_file.schema_arrow
+
+        violations, needs_data = contract.check_arrow_schema(schema)
+        stat_violations, stat_needs = contract.check_statistics(parquet_file.metadata, schema)
+        violations += stat_violations
+        needs_data = {c for c in needs_data | stat_needs if c in schema.names}
+
+        if violations or not needs_data or parquet_file.metadata.num_rows == 0:
+            return violations, "metadata"
+
+        batch = next(parquet_file.iter_batches(batch_size=self.sample_rows, columns=sorted(needs_data)))
+        return violations + contract.check_frame(batch.to_pandas(), needs_data), "metadata+sample"
+
+    def validate_file(self, path: str, source: Optional[str] = None) -> Dict[str, Any]:
+        path = Path(path)
+        source = source or path.stem
+        contract = self.contracts.get(source)
+
+        if contract is None:
+            self.report[source] = {"status": "no_contract"}
+            return self.report[source]
+
+        if path.suffix == ".parquet":
+            violations, checked_on = self._validate_parquet(contract, path)
+        else:
+            head = self._read_head(path)
+            violations = contract.check_columns(head.columns)
+            if not violations:
+                violations = contract.check_frame(head)
+            checked_on = f"first {len(head)} rows"
+
+        self.report[source] = {
+            "status": "failed" if violations else "passed",
+            "checked_on": checked_on,
+            "violations": violations,
+        }
+
+        if violations:
+            raise SchemaContractError(source, str(path), violations)
+
+        return self.report[source]
@@ -0,0 +1,314 @@
+# src/synthetic_data.py
+
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+EXCEL_MAX_ROWS = 1_048_575
+
+DEFAULT_FORMATS = {
+    "application_metadata": "csv",
+    "credit_history": "parquet",
+    "demographics": "csv",
+    "financial_ratios": "jsonl",
+    "geographic_data": "xml",
+    "loan_details": "xlsx",
+}
+
+EMPLOYMENT_VARIANTS = {
+    "full_time": ["Full-time", "FULL_TIME", "Full Time", "Fulltime", "FT"],
+    "part_time": ["Part-time", "PART_TIME", "Part Time", "PT"],
+    "self_employed": ["Self-employed", "SELF_EMPLOYED", "Self Employed", "Self Emp"],
+    "contract": ["Contract", "CONTRACT", "Contractor"],
+}
+
+ACCOUNT_STATUS_CODES = ["ACT-1", "ACT-2", "ACT-3", "A01", "A02", "A03"]
+
+LOAN_TYPE_VARIANTS = [
+    "Personal", "personal", "PERSONAL", "Personal Loan",
+    "Mortgage", "mortgage", "MORTGAGE", "Home Loan",
+    "Credit Card", "credit card", "CreditCard", "CC",
+]
+
+STATES = ["CA", "TX", "FL", "NY", "IL", "PA", "OH", "NC", "MI", "GA",
+          "MD", "VA", "MA", "MO", "NJ", "WI", "WA", "AZ", "IN", "TN"]
+STATE_WEIGHTS = np.array([11552, 9595, 7806, 7595, 4771, 4684, 3842, 3839, 3838, 3779,
+                          2999, 2921, 2878, 2877, 2877, 2859, 2852, 2825, 2820, 2790], dtype=float)
+
+
+class SyntheticDataGenerator:
+    def __init__(
+            self,
+            n_rows: int = 10_000,
+            random_state: int = 42,
+            formats: Optional[Dict[str, str]] = None,
+            default_rate: float = 0.05,
+            dirty_fraction: float = 0.5,
+            shuffle: bool = True,
+            first_customer_id: int = 10000
+    ):
+        self.n_rows = n_rows
+        self.random_state = random_state
+        self.formats = dict(DEFAULT_FORMATS)
+        if formats:
+            self.formats.update(formats)
+        self.default_rate = default_rate
+        self.dirty_fraction = dirty_fraction
+        self.shuffle = shuffle
+        self.first_customer_id = first_customer_id
+
+        self.rng = np.random.default_rng(random_state)
+
+    def _currency(self, values: np.ndarray, decimals: int = 0) -> np.ndarray:
+        # mix of "$1,234", "1,234", "$1234" and plain "1234" like the raw exports
+        n = len(values)
+        with_commas = pd.Series(values).map(f"{{:,.{decimals}f}}".format).to_numpy(dtype=object)
+        plain = pd.Series(values).map(f"{{:.{decimals}f}}".format).to_numpy(dtype=object)
+
+        style = self.rng.integers(0, 4, n)
+        style[self.rng.random(n) > self.dirty_fraction] = 3
+
+        out = np.where(style < 2, with_commas, plain)
+        dollar = (style == 0) | (style == 2)
+        out[dollar] = "$" + out[dollar]
+        return out
+
+    def _pad(self, values: np.ndarray) -> np.ndarray:
+        values = values.astype(object)
+        mask = self.rng.random(len(values)) < self.dirty_fraction * 0.2
+        values[mask] = "  " + values[mask] + " "
+        return values
+
+    def _with_missing(self, values: np.ndarray, rate: float) -> np.ndarray:
+        values = values.astype(np.float64)
+        values[self.rng.random(len(values)) < rate] = np.nan
+        return values
+
+    def _latent(self) -> Dict[str, np.ndarray]:
+        n = self.n_rows
+        rng = self.rng
+
+        age = np.clip(rng.normal(39, 10, n), 18, 74).astype(np.int64)
+        annual_income = np.round(np.exp(rng.normal(10.6, 0.45, n)), -2)
+        credit_score = np.clip(rng.normal(680, 55, n), 300, 850).astype(np.int64)
+        dti = np.clip(rng.gamma(4.0, 0.07, n), 0.01, 1.5)
+        utilization = np.clip(rng.beta(2, 3, n), 0, 1)
+
+        # default probability driven by the same latent risk the features carry
+        risk = (
+            -0.012 * (credit_score - 680)
+            + 2.5 * (dti - 0.28)
+            + 1.2 * (utilization - 0.4)
+            - 0.6 * (np.log(annual_income) - 10.6)
+            + rng.normal(0, 0.5, n)
+        )
+        intercept = np.log(self.default_rate / (1 - self.default_rate))
+        p_default = 1 / (1 + np.exp(-(intercept + risk)))
+        default = (rng.random(n) < p_default).astype(np.int64)
+
+        return {
+            "customer_id": np.arange(self.first_customer_id, self.first_customer_id + n),
+            "age": age,
+            "annual_income": annual_income,
+            "credit_score": credit_score,
+            "dti": dti,
+            "utilization": utilization,
+            "default": default,
+        }
+
+    def application_metadata(self, latent: Dict[str, np.ndarray]) -> pd.DataFrame:
+        n, rng = self.n_rows, self.rng
+
+        referral = np.where(
+            rng.random(n) < 0.8, "REF0000",
+            np.char.add("REF", np.char.zfill(rng.integers(1, 9999, n).astype(str), 4))
+        )
+
+        return pd.DataFrame({
+            "customer_ref": latent["customer_id"],
+            "application_id": rng.integers(500000, 700000, n),
+            "application_hour": rng.integers(0, 24, n),
+            "application_day_of_week": rng.integers(0, 7, n),
+            "account_open_year": rng.integers(2000, 2024, n),
+            "preferred_contact": self._pad(rng.choice(["Email", "Phone", "Mail"], n)),
+            "referral_code": referral,
+            "account_status_code": self._pad(rng.choice(ACCOUNT_STATUS_CODES, n)),
+            "random_noise_1": rng.normal(0, 1, n),
+            "num_login_sessions": rng.poisson(6 + 4 * (1 - latent["default"]), n),
+            "num_customer_service_calls": rng.poisson(1.5 + latent["default"], n),
+            "has_mobile_app": (rng.random(n) < 0.7).astype(np.int64),
+            "paperless_billing": (rng.random(n) < 0.6).astype(np.int64),
+            "default": latent["default"],
+        })
+
+    def credit_history(self, latent: Dict[str, np.ndarray]) -> pd.DataFrame:
+        n, rng = self.n_rows, self.rng
+
+        oldest_years = np.round(np.clip(rng.gamma(2.0, 4.0, n), 0, latent["age"] - 18), 1)
+        inquiries = rng.poisson(2 + 2 * latent["utilization"], n)
+        total_credit_limit = np.round(latent["annual_income"] * rng.uniform(0.5, 2.5, n), -2)
+
+        return pd.DataFrame({
+            "customer_number": latent["customer_id"],
+            "credit_score": latent["credit_score"],
+            "num_credit_accounts": rng.integers(1, 20, n),
+            "oldest_credit_line_age": oldest_years,
+            "oldest_account_age_months": oldest_years * 12,
+            "total_credit_limit": total_credit_limit,
+            "num_delinquencies_2yrs": self._with_missing(
+                rng.choice([0, 1, 2], n, p=[0.972, 0.027, 0.001]), 0.01
+            ),
+            "num_inquiries_6mo": inquiries,
+            "recent_inquiry_count": inquiries,
+            "num_public_records": (rng.random(n) < 0.07).astype(np.int64),
+            "num_collections": (rng.random(n) < 0.03 + 0.1 * latent["default"]).astype(np.int64),
+            "account_diversity_index": np.round(rng.uniform(0, 1, n), 3),
+        })
+
+    def demographics(self, latent: Dict[str, np.ndarray]) -> pd.DataFrame:
+        n, rng = self.n_rows, self.rng
+
+        groups = rng.choice(list(EMPLOYMENT_VARIANTS), n, p=[0.7, 0.1, 0.12, 0.08])
+        employment_type = np.empty(n, dtype=object)
+        for group, variants in EMPLOYMENT_VARIANTS.items():
+            mask = groups == group
+            employment_type[mask] = rng.choice(variants, mask.sum())
+
+        return pd.DataFrame({
+            "cust_id": latent["customer_id"],
+            "age": latent["age"],
+            "annual_income": self._currency(latent["annual_income"]),
+            "employment_length": self._with_missing(
+                np.round(rng.gamma(2.0, 2.5, n), 1), 0.025
+            ),
+            "employment_type": self._pad(employment_type),
+            "education": self._pad(rng.choice(
+                ["High School", "Some College", "Bachelor", "Graduate", "Advanced"], n,
+                p=[0.3, 0.2, 0.3, 0.15, 0.05]
+            )),
+            "marital_status": rng.choice(["Married", "Single", "Divorced"], n, p=[0.45, 0.4, 0.15]),
+            "num_dependents": rng.choice(6, n, p=[0.32, 0.34, 0.205, 0.09, 0.03, 0.015]),
+        })
+
+    def financial_ratios(self, latent: Dict[str, np.ndarray]) -> pd.DataFrame:
+        n, rng = self.n_rows, self.rng
+
+        monthly_income = np.round(latent["annual_income"] / 12, 2)
+        existing_debt = np.round(monthly_income * latent["dti"] * rng.uniform(0.3, 0.7, n), 2)
+        monthly_payment = np.round(monthly_income * latent["dti"] - existing_debt, 2).clip(0)
+        total_monthly = existing_debt + monthly_payment
+        credit_limit = np.round(latent["annual_income"] * rng.uniform(0.2, 1.5, n), 1)
+        usage = np.round(credit_limit * latent["utilization"], 1)
+
+        return pd.DataFrame({
+            "cust_num": latent["customer_id"],
+            "monthly_income": self._currency(monthly_income, 2),
+            "existing_monthly_debt": self._currency(existing_debt, 2),
+            "monthly_payment": self._currency(monthly_payment, 2),
+            "debt_to_income_ratio": np.round(latent["dti"], 3),
+            "debt_service_ratio": total_monthly / monthly_income,
+            "payment_to_income_ratio": np.round(monthly_payment / monthly_income, 3),
+            "credit_utilization": np.round(latent["utilization"], 3),
+            "revolving_balance": np.where(rng.random(n) < 0.015, None, self._currency(usage, 2)),
+            "credit_usage_amount": self._currency(usage, 2),
+            "available_credit": self._currency(credit_limit - usage, 2),
+            "total_monthly_debt_payment": self._currency(total_monthly, 2),
+            "annual_debt_payment": np.round(total_monthly * 12, 2),
+            "loan_to_annual_income": np.round(rng.gamma(2.0, 0.15, n), 3),
+            "total_debt_amount": self._currency(np.round(total_monthly * rng.uniform(10, 60, n), 2), 2),
+            "monthly_free_cash_flow": self._currency(monthly_income - total_monthly, 2),
+        })
+
+    def geographic_data(self, latent: Dict[str, np.ndarray]) -> pd.DataFrame:
+        n, rng = self.n_rows, self.rng
+
+        return pd.DataFrame({
+            "id": latent["customer_id"],
+            "state": rng.choice(STATES, n, p=STATE_WEIGHTS / STATE_WEIGHTS.sum()),
+            "regional_unemployment_rate": np.round(rng.uniform(3.0, 7.0, n), 1),
+            "regional_median_income": rng.integers(45, 90, n) * 1000,
+            "regional_median_rent": np.round(rng.uniform(900, 2500, n), -1),
+            "housing_price_index": np.round(rng.uniform(80, 170, n)),
+            "cost_of_living_index": np.round(rng.uniform(70, 140, n)),
+            "previous_zip_code": rng.integers(100, 999, n),
+        })
+
+    def loan_details(self, latent: Dict[str, np.ndarray]) -> pd.DataFrame:
+        n, rng = self.n_rows, self.rng
+
+        loan_type = rng.choice(LOAN_TYPE_VARIANTS, n)
+        is_mortgage = np.isin(loan_type, ["Mortgage", "mortgage", "MORTGAGE", "Home Loan"])
+        loan_amount = np.where(
+            is_mortgage,
+            np.round(rng.uniform(80_000, 450_000, n), -2),
+            np.round(rng.uniform(1_000, 40_000, n), -2)
+        )
+
+        return pd.DataFrame({
+            "customer_id": latent["customer_id"],
+            "loan_type": self._pad(loan_type),
+            "loan_amount": self._currency(loan_amount),
+            "loan_term": np.where(is_mortgage, rng.choice([180, 360], n), rng.choice([24, 36, 48, 60], n)),
+            "interest_rate": np.round(rng.uniform(5, 20, n) + 0.004 * (700 - latent["credit_score"]), 2),
+            "loan_purpose": rng.choice(
+                ["Debt Consolidation", "Refinance", "Major Purchase", "Medical",
+                 "Home Improvement", "Business", "Other"], n
+            ),
+            "loan_to_value_ratio": np.where(is_mortgage, np.round(rng.uniform(0.5, 0.95, n), 3), 0.0),
+            "origination_channel": rng.choice(["Online", "Branch", "Direct Mail", "Broker"], n),
+            "loan_officer_id": rng.integers(1000, 1100, n),
+            "marketing_campaign": rng.choice(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"), n),
+        })
+
+    def generate(self) -> Dict[str, pd.DataFrame]:
+        latent = self._latent()
+
+        tables = {
+            "application_metadata": self.application_metadata(latent),
+            "credit_history": self.credit_history(latent),
+            "demographics": self.demographics(latent),
+            "financial_ratios": self.financial_ratios(latent),
+            "geographic_data": self.geographic_data(latent),
+            "loan_details": self.loan_details(latent),
+        }
+
+        if self.shuffle:
+            for name, df in tables.items():
+                tables[name] = df.iloc[self.rng.permutation(len(df))].reset_index(drop=True)
+
+        return tables
+
+    def _write(self, df: pd.DataFrame, path: Path, fmt: str):
+        if fmt == "csv":
+            df.to_csv(path, index=False)
+        elif fmt == "parquet":
+            df.to_parquet(path, index=False)
+        elif fmt == "jsonl":
+            df.to_json(path, orient="records", lines=True)
+        elif fmt == "xml":
+            df.to_xml(path, index=False)
+        elif fmt == "xlsx":
+            df.to_excel(path, index=False)
+        else:
+            raise ValueError(f"Unsupported format: {fmt}")
+
+    def write(self, output_dir: str) -> Dict[str, str]:
+        output_dir = Path(output_dir)
+        output_dir.mkdir(exist_ok=True, parents=True)
+
+        written = {}
+
+        for name, df in self.generate().items():
+            fmt = self.formats[name]
+
+            if fmt == "xlsx" and len(df) > EXCEL_MAX_ROWS:
+                print(f"{name}: {len(df)} rows exceed the Excel sheet limit, writing csv instead")
+                fmt = "csv"
+
+            path = output_dir / f"{name}.{fmt}"
+            self._write(df, path, fmt)
+            written[name] = str(path)
+
+        return written